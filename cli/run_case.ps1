@@ -32,6 +32,9 @@ param(
   [string]$PlotScript  = (Join-Path $PSScriptRoot "plot_hwinfo.py"),
   [string[]]$TempPatterns = @("CPU Package", "GPU Temperature", "GPU VRM", "SPD Hub"),
 
+  # Patterns one per line (UTF-8). The GUI launches via -File, which can't bind [string[]].
+  [string]$TempPatternsFile = "",
+
   # Abort flag file (works for GUI/no-console runs)
   [string]$AbortFlag = (Join-Path $env:TEMP "temptesting_abort.flag"),
 
@@ -249,6 +252,10 @@ if (-not (Test-Path $HwinfoCsv)) {
 
 Clear-AbortFlag
 
+if ($TempPatternsFile -and (Test-Path -LiteralPath $TempPatternsFile)) {
+  $TempPatterns = @(Get-Content -LiteralPath $TempPatternsFile -Encoding UTF8 | Where-Object { $_ -ne "" })
+}
+
 $scriptDir = $PSScriptRoot
 
 # In a frozen app, this script typically lives at <AppRoot>\_internal\cli\run_case.ps1.
@@ -1,9 +1,87 @@
 # settings_store.py
+import copy
 import json
+import mmap
 import os
+from dataclasses import asdict, dataclass, field
 from pathlib import Path
 from typing import Any
 
+try:
+    import orjson
+except ImportError:
+    # Optional speedup; stdlib json is used when orjson isn't installed.
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:
+    # Optional; only used to encode the fixed-shape Settings payload.
+    msgspec = None
+
+
+@dataclass(slots=True)
+class Settings:
+    """Fixed-shape settings payload written by the main window."""
+
+    case_name: str = ""
+    hwinfo_csv: str = ""
+    warmup_min: int = 0
+    warmup_sec: int = 0
+    log_min: int = 0
+    log_sec: int = 0
+    fur_demo_display: str = ""
+    fur_res_display: str = ""
+    selected_tokens: list[str] = field(default_factory=list)
+    stress_cpu: bool = True
+    stress_gpu: bool = True
+    furmark_exe: str = ""
+    prime_exe: str = ""
+    ntfy_topic: str = ""
+    theme: str = "dark"
+
+
+# Settings are machine-written; pretty-printing is opt-in for debugging/diffing.
+_PRETTY = (os.environ.get("THERMALBENCH_PRETTY") or "").strip().lower() in {"1", "true", "yes", "on"}
+
+
+# Parsed settings keyed by path -> (st_mtime_ns, st_size, data).
+# Repeat loads of an unchanged file skip both the read and the parse.
+_cache: dict[Path, tuple[int, int, dict[str, Any]]] = {}
+
+# Last bytes we wrote per path -> (hash(buf), st_mtime_ns, st_size), so no-op saves
+# (e.g. "Apply" without real changes) skip rewriting the file.
+_last_written_hash: dict[Path, tuple[int, int, int]] = {}
+
+# Built once at import so the per-type encoding plan is reused across saves.
+_settings_encoder = msgspec.json.Encoder() if msgspec is not None else None
+
+
+def _dumps(data: Any) -> bytes:
+    if _settings_encoder is not None and isinstance(data, Settings) and not _PRETTY:
+        return _settings_encoder.encode(data)
+    if orjson is not None:
+        # orjson serializes dataclasses natively (no asdict() round-trip). Non-str keys
+        # are stringified like stdlib json does instead of raising TypeError.
+        opt = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if _PRETTY else 0)
+        return orjson.dumps(data, option=opt)
+    if isinstance(data, Settings):
+        data = asdict(data)
+    if _PRETTY:
+        return json.dumps(data, indent=2).encode("utf-8")
+    return json.dumps(data, separators=(",", ":")).encode("utf-8")
+
+
+# Files above this size are parsed straight from a read-only mapping (no userspace
+# copy). Only orjson accepts buffer objects; stdlib json needs bytes/str.
+_MMAP_THRESHOLD = 64 * 1024
+
+
+def _loads(raw: bytes | memoryview) -> Any:
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
 
 def get_settings_path(app_name: str = "ThermalBench") -> Path:
     """
@@ -21,17 +99,67 @@ def get_settings_path(app_name: str = "ThermalBench") -> Path:
 
 
 def load_json(path: Path) -> dict[str, Any]:
-    if not path.exists():
+    try:
+        st = path.stat()
+    except OSError:
+        # Missing file is the common first-run case.
         return {}
+
+    hit = _cache.get(path)
+    if hit is not None and hit[0] == st.st_mtime_ns and hit[1] == st.st_size:
+        # Callers may mutate what they get back; never hand out the cached object.
+        return copy.deepcopy(hit[2])
+
     try:
-        return json.loads(path.read_text(encoding="utf-8"))
-    except Exception:
+        with open(path, "rb") as f:
+            if orjson is not None and st.st_size > _MMAP_THRESHOLD:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as view:
+                    data = _loads(view)
+            else:
+                data = _loads(f.read())
+    except (OSError, ValueError):
+        # Unreadable or corrupt (json/orjson decode errors are ValueErrors).
         return {}
 
+    _cache[path] = (st.st_mtime_ns, st.st_size, data)
+    return copy.deepcopy(data)
+
+
+def save_json(path: Path, data: dict[str, Any] | Settings) -> None:
+    # Write to a sibling temp file and swap it in, so a crash mid-write never
+    # leaves a truncated settings.json behind.
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    buf = _dumps(data)
+    h = hash(buf)
+
+    prev = _last_written_hash.get(path)
+    if prev is not None and prev[0] == h:
+        # Same bytes as last time; only skip if nobody touched the file since.
+        try:
+            st = path.stat()
+            if st.st_mtime_ns == prev[1] and st.st_size == prev[2]:
+                return
+        except OSError:
+            pass
 
-def save_json(path: Path, data: dict[str, Any]) -> None:
     try:
-        path.write_text(json.dumps(data, indent=2), encoding="utf-8")
-    except Exception:
+        tmp.write_bytes(buf)
+        os.replace(tmp, path)
+    except OSError:
         # don't crash the app if disk is locked / read-only
-        pass
+        try:
+            tmp.unlink(missing_ok=True)
+        except OSError:
+            pass
+        _cache.pop(path, None)
+        _last_written_hash.pop(path, None)
+        return
+
+    try:
+        st = path.stat()
+        cached = asdict(data) if isinstance(data, Settings) else copy.deepcopy(data)
+        _cache[path] = (st.st_mtime_ns, st.st_size, cached)
+        _last_written_hash[path] = (h, st.st_mtime_ns, st.st_size)
+    except OSError:
+        _cache.pop(path, None)
+        _last_written_hash.pop(path, None)
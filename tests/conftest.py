@@ -0,0 +1,17 @@
+import pathlib
+import sys
+
+import pytest
+
+# Make the repo root importable once for every collected test module.
+_repo_root = str(pathlib.Path(__file__).resolve().parent.parent)
+if _repo_root not in sys.path:
+    sys.path.insert(0, _repo_root)
+
+
+@pytest.fixture(scope="session")
+def qapp():
+    """One QApplication shared by every Qt test (plugin scan + theme detection run once)."""
+    QtWidgets = pytest.importorskip("PySide6.QtWidgets")
+    app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+    yield app
@@ -1,8 +1,8 @@
-import importlib
-import os
+import pathlib
 import sys
 
-_repo_root = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+# Run as a plain script (not collected by pytest), so conftest.py doesn't apply.
+_repo_root = str(pathlib.Path(__file__).resolve().parent.parent)
 if _repo_root not in sys.path:
     sys.path.insert(0, _repo_root)
 
@@ -14,9 +14,41 @@ modules = [
     'app',
 ]
 
-for m in modules:
+
+def _try_import(m):
+    """Return (name, error_or_None)."""
     try:
-        importlib.import_module(m)
-        print(m, 'OK')
+        # Absolute names only, so skip importlib's relative-name handling.
+        __import__(m)
+        return m, None
     except Exception as e:
-        print(m, 'ERR:', type(e).__name__, e)
+        return m, e
+
+
+def run():
+    from concurrent.futures import ThreadPoolExecutor
+
+    # Snapshot on the main thread: checked inside the workers, a module another
+    # worker is still importing would already be in sys.modules.
+    cached = {m for m in modules if m in sys.modules}
+    pending = [m for m in modules if m not in cached]
+
+    # Imports are independent; overlap their filesystem work, but report from the
+    # main thread so output isn't interleaved.
+    errors = {}
+    if pending:
+        with ThreadPoolExecutor(max_workers=len(pending)) as ex:
+            errors = dict(ex.map(_try_import, pending))
+
+    lines = []
+    for m in modules:
+        e = errors.get(m)
+        if e is None:
+            lines.append(f"{m} OK (cached)" if m in cached else f"{m} OK")
+        else:
+            lines.append(f"{m} ERR: {type(e).__name__} {e}")
+    sys.stdout.write("\n".join(lines) + "\n")
+
+
+if __name__ == "__main__":
+    run()
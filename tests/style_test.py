@@ -1,19 +1,46 @@
-import os
+import pathlib
 import sys
 
-_repo_root = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+# Also runnable as a plain script (`python tests/style_test.py`), where conftest.py
+# doesn't apply.
+_repo_root = str(pathlib.Path(__file__).resolve().parent.parent)
 if _repo_root not in sys.path:
-	sys.path.insert(0, _repo_root)
+    sys.path.insert(0, _repo_root)
 
-from PySide6.QtWidgets import QApplication
 
-from ui.widgets.ui_widgets import CustomComboBox
-from ui.ui_settings_dialog import SettingsDialog
+def test_widgets_apply_styles(qapp):
+    # Deferred so that merely importing this module (e.g. pytest collection)
+    # doesn't pay for Qt initialization.
+    from PySide6.QtWidgets import QWidget
 
-app = QApplication([])
-# Instantiate some widgets that apply stylesheets
-cb = CustomComboBox(mode='dark')
-dlg = SettingsDialog(None, furmark_exe='', prime_exe='', theme='dark')
-print('widgets created')
-# Clean up
-app.quit()
+    from ui.widgets.ui_widgets import CustomComboBox
+    from ui.ui_settings_dialog import SettingsDialog
+
+    qapp.processEvents()
+
+    # Build under one hidden parent with updates off so style polishing is
+    # deferred to a single pass when updates are re-enabled.
+    host = QWidget()
+    host.setUpdatesEnabled(False)
+    try:
+        # Instantiate some widgets that apply stylesheets
+        cb = CustomComboBox(host, mode='dark')
+        dlg = SettingsDialog(host, furmark_exe='', prime_exe='', theme='dark')
+    finally:
+        host.setUpdatesEnabled(True)
+    assert cb.parent() is host and dlg.parent() is host
+    host.deleteLater()
+
+
+def main():
+    from PySide6.QtWidgets import QApplication
+
+    app = QApplication.instance() or QApplication([])
+    test_widgets_apply_styles(app)
+    print('widgets created')
+    # Clean up
+    app.quit()
+
+
+if __name__ == "__main__":
+    main()
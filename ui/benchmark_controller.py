@@ -1,16 +1,45 @@
 # benchmark_controller.py
 """Benchmark execution and results browsing component."""
 
+import operator
 import os
 import re
 import shutil
+import stat
+import subprocess
+import tempfile
 import time
 import json
+import math
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from itertools import chain
 from pathlib import Path
 from datetime import datetime
-from typing import Optional
-
-from PySide6.QtCore import QProcess, QTimer, QItemSelectionModel, Qt
+from types import MappingProxyType
+from typing import Mapping, Optional
+
+try:
+    import orjson
+except ImportError:
+    # Optional speedup for manifest writes; stdlib json is used otherwise.
+    orjson = None
+
+from PySide6.QtCore import (
+    QFileSystemWatcher,
+    QItemSelection,
+    QItemSelectionModel,
+    QItemSelectionRange,
+    QObject,
+    QProcess,
+    QRect,
+    QRunnable,
+    QThreadPool,
+    QTimer,
+    Qt,
+    Signal,
+)
+from PySide6.QtGui import QTextCursor
 from PySide6.QtWidgets import (
     QTreeView,
     QFileSystemModel,
@@ -24,30 +53,341 @@ from PySide6.QtWidgets import (
     QTextEdit,
 )
 
-from core.ps_helpers import RUNMAP_RE, ps_quote, build_ps_array_literal
 
 from core.resources import resource_path
+from core.ps_helpers import RUNMAP_RE
+from core.settings_store import get_settings_path, load_json, save_json
 from core.hwinfo_metadata import load_sensor_map
-from ui.graph_preview.graph_plot_helpers import load_run_csv_dataframe
-from ui.graph_preview.graph_plot_helpers import extract_unit_from_column, get_measurement_type_label
+from ui.graph_preview.graph_plot_helpers import (
+    extract_unit_from_column,
+    get_measurement_type_label,
+    load_run_csv_dataframe,
+)
 from ui.graph_preview.legend_popup_helpers import raise_center_and_focus
 from ui.graph_preview.ui_compare_popup import ComparePopup
 from ui.graph_preview.ui_dim_overlay import DimOverlay
 
-_RUN_FOLDER_RE = re.compile(
-    r"^(?:"
-    r"\d{8}_\d{6}"
-    r"|(?:CPU|GPU|CPUGPU)_W\d+_L\d+_V\d+"
-    # Compare result folders (created by GUI): "<case> CPU vs <case> CPUGPU" (+ optional suffix)
-    r"|.+\s(?:CPU|GPU|CPUGPU)\svs\s.+\s(?:CPU|GPU|CPUGPU)(?:\s\+\d+)?"
-    r")$",
+# Plain run folders: "<YYYYMMDD_HHMMSS>" or "<CPU|GPU|CPUGPU>_W<n>_L<n>_V<n>".
+_RUN_ID_RE = re.compile(
+    r"^(?:\d{8}_\d{6}|(?:CPU|GPU|CPUGPU)_W\d+_L\d+_V\d+)$",
+    re.IGNORECASE,
+)
+
+# Compare result folders (created by GUI): "<case> CPU vs <case> CPUGPU" (+ optional suffix)
+_COMPARE_NAME_RE = re.compile(
+    r".+\s(?:CPU|GPU|CPUGPU)\svs\s.+\s(?:CPU|GPU|CPUGPU)(?:\s\+\d+)?",
     re.IGNORECASE,
 )
 
 
+# Max paragraphs kept in the run log; Qt drops the oldest beyond this, so appends
+# stay constant-time on long, chatty runs.
+_LOG_MAX_BLOCKS = 5000
+
+# After writing the abort flag, give run_case.ps1 this long to notice it (it polls
+# once per second while counting down) before falling back to -StopNow.
+_ABORT_FALLBACK_MS = 5000
+
+# Every stdout marker emitted by run_case.ps1, matched in one pass per line and
+# dispatched on `lastgroup`.
+_GUI_MARKERS_RE = re.compile(
+    r"^GUI_AMBIENT_CSV:(?P<ambient>.*)$"
+    "|" + RUNMAP_RE.pattern
+)
+
+# run_case.ps1 writes the timer markers as whole lines; one prefix test plus a dict
+# lookup replaces scanning every output line for each of them.
+_TIMER_PREFIX = "GUI_TIMER:"
+_TIMER_DISPATCH = {
+    "GUI_TIMER:WARMUP_START": "warm",
+    "GUI_TIMER:LOG_START": "logs",
+    "GUI_TIMER:LOG_END": "loge",
+}
+
+
+def _is_compare_name(name: str) -> bool:
+    # Cheap literal pre-check so ordinary names never reach the backtracking pattern.
+    return " vs " in name.lower() and _COMPARE_NAME_RE.fullmatch(name) is not None
+
+
+@lru_cache(maxsize=4096)
+def _is_run_folder_name(name: str) -> bool:
+    """True if a folder basename is shaped like a run (or compare result) folder."""
+    return _RUN_ID_RE.match(name) is not None or _is_compare_name(name)
+
+
+def _valid_run_dir(path_str: str, root_prefix: tuple[str, ...]) -> Optional[Path]:
+    """
+    Run folder for a tree path (the folder itself, or the parent of a file in it).
+
+    One lstat plus string checks: the folder must be shaped like a run folder and
+    lie under one of the normalized `root_prefix` strings. Only symlinks get
+    resolved, so a link can't smuggle an outside folder into the runs tree.
+    """
+    if not root_prefix:
+        return None
+    try:
+        st = os.lstat(path_str)
+    except OSError:
+        return None
+
+    check_str = path_str
+    if stat.S_ISLNK(st.st_mode):
+        check_str = os.path.realpath(path_str)
+        try:
+            st = os.stat(check_str)
+        except OSError:
+            return None
+
+    if not stat.S_ISDIR(st.st_mode):
+        path_str = os.path.dirname(path_str)
+        check_str = os.path.dirname(check_str)
+
+    if not _is_run_folder_name(os.path.basename(path_str)):
+        return None
+    if not os.path.normcase(check_str).startswith(root_prefix):
+        return None
+    return Path(path_str)
+
+
+def _json_bytes(obj) -> bytes:
+    """Indented UTF-8 JSON for small per-run files (orjson when available)."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2).encode("utf-8")
+
+
+def _stat_or_none(p) -> Optional[os.stat_result]:
+    """One stat syscall in place of exists()/is_dir() chains."""
+    try:
+        return os.stat(p)
+    except (OSError, ValueError):
+        return None
+
+
+def _norm_path(p) -> str:
+    """Case/separator-normalized path string for cheap equality checks (no syscalls)."""
+    return os.path.normcase(os.path.normpath(str(p)))
+
+
+# Bundled resource; its location is fixed for the process lifetime.
+_SENSOR_MAP_PATH = resource_path("resources", "sensor_map.json")
+
+
+@lru_cache(maxsize=1)
+def _load_group_map(mtime_ns: int) -> Mapping[str, str]:
+    payload = load_sensor_map(_SENSOR_MAP_PATH)
+    if isinstance(payload, dict) and payload.get("schema") == 1:
+        return MappingProxyType(dict(payload.get("mapping") or {}))
+    return MappingProxyType({})
+
+
+def _cached_group_map() -> Mapping[str, str]:
+    """Read-only sensor -> HWiNFO group map, re-parsed only when sensor_map.json changes."""
+    try:
+        mtime_ns = _SENSOR_MAP_PATH.stat().st_mtime_ns
+    except OSError:
+        return MappingProxyType({})
+    return _load_group_map(mtime_ns)
+
+
+@lru_cache(maxsize=64)
+def _cached_run_csv_columns(path_str: str, mtime_ns: int, size: int) -> tuple[str, ...]:
+    # Keyed on mtime/size so a rewritten CSV is re-read; tuple so callers can't
+    # mutate the shared cached value. Full parse, so the columns match what the
+    # plot loader yields; raises for CSVs the plot path rejects.
+    return tuple(load_run_csv_dataframe(path_str)[1])
+
+
+def _run_csv_sensor_columns(csvp: Path) -> tuple[str, ...]:
+    """Sensor columns of a run CSV (memoized across compares)."""
+    st = os.stat(csvp)
+    return _cached_run_csv_columns(str(csvp), st.st_mtime_ns, st.st_size)
+
+
+_COMPARE_TYPE_PRIO = {
+    "Temperature": 0,
+    "Power (W)": 1,
+    "RPM": 2,
+    "Voltage (V)": 3,
+    "Percentage (%)": 4,
+    "Clock (MHz)": 5,
+    "Timing (T)": 6,
+}
+
+
+@lru_cache(maxsize=4096)
+def _compare_type_prio(name: str) -> int:
+    """Measurement-type rank of a sensor column (memoized: unit parsing per name is repeated)."""
+    try:
+        unit = extract_unit_from_column(name)
+        label = str(get_measurement_type_label(unit))
+    except Exception:
+        label = "[other]"
+    return int(_COMPARE_TYPE_PRIO.get(label, 99))
+
+
+@lru_cache(maxsize=4096)
+def _compare_device_subprio(name: str, group: str) -> int:
+    """CPU -> GPU -> Ambient -> other, using both the column name and its HWiNFO group title."""
+    t = f"{name} {group}".lower()
+    # CPU-ish
+    if "cpu" in t or "package" in t or "ccd" in t or "tctl" in t:
+        return 0
+    # GPU-ish
+    if "gpu" in t:
+        return 1
+    # Ambient
+    if "ambient" in t or "room" in t:
+        return 2
+    return 3
+
+
+@lru_cache(maxsize=4096)
+def _compare_sort_key(name: str, group: str) -> tuple[int, int, str]:
+    """Full compare ordering key, memoized so a re-sort is one lookup per sensor."""
+    return (_compare_type_prio(name), _compare_device_subprio(name, group), name.lower())
+
+
+_STRESS_KINDS = ("CPU", "GPU", "CPUGPU")
+
+
+def _stress_kind_from_name(name: str) -> str:
+    """"CPU"/"GPU"/"CPUGPU" for a "<kind>_W<n>_L<n>_V<n>" folder name, else ""."""
+    head, sep, tail = name.upper().partition("_W")
+    if not sep or head not in _STRESS_KINDS:
+        return ""
+    w, sep_l, rest = tail.partition("_L")
+    l, sep_v, v = rest.partition("_V")
+    if not (sep_l and sep_v):
+        return ""
+    if not (w.isdigit() and l.isdigit() and v.isdigit()):
+        return ""
+    # isdigit() accepts non-ASCII digits; the folder grammar is ASCII-only.
+    if not (w.isascii() and l.isascii() and v.isascii()):
+        return ""
+    return head
+
+
+@lru_cache(maxsize=256)
+def _stress_kind_from_settings(path_str: str, mtime_ns: int) -> str:
+    """Stress kind from a run's test_settings.json (memoized on file mtime)."""
+    try:
+        with open(path_str, "rb") as f:
+            s = json.loads(f.read())
+    except (OSError, ValueError):
+        return ""
+    sm = str((s or {}).get("stress_mode") or "").upper() if isinstance(s, dict) else ""
+    if "CPU" in sm and "GPU" in sm:
+        return "CPUGPU"
+    if "GPU" in sm:
+        return "GPU"
+    if "CPU" in sm:
+        return "CPU"
+    return ""
+
+
+# The only entries the latest-run scan looks at inside a run folder; everything
+# else (sensor CSVs, PNGs, logs) is rejected with one set lookup.
+_RUN_SCAN_NAMES = frozenset({"run_window.csv", "ALL_SELECTED.png", "compare_manifest.json"})
+
+
+@lru_cache(maxsize=4096)
+def _fmt_mmss(total_seconds: int) -> str:
+    return f"{total_seconds//60:02d}:{total_seconds%60:02d}"
+
+
+@lru_cache(maxsize=4096)
+def _timer_label(phase: str, remaining_sec: int) -> str:
+    # Live timer text; a run counts through the same values every time.
+    return f"{phase}  {_fmt_mmss(max(0, remaining_sec))}"
+
+
+def _take_lines(buf: bytearray, chunk: bytes) -> str:
+    """
+    Append `chunk` to `buf` and return the complete lines it now holds, as one string.
+
+    The unterminated tail stays in `buf`, so a line split across two reads is only
+    decoded once it is whole. Complete lines are decoded in one go; a newline byte
+    never occurs inside a UTF-8 sequence, so cutting at it is always safe.
+    """
+    if not buf and chunk.endswith(b"\n"):
+        # Usual case: the read ended on a line boundary, nothing to carry over.
+        return chunk.decode("utf-8", errors="replace")
+    buf += chunk
+    end = buf.rfind(b"\n") + 1
+    if not end:
+        return ""
+    # Decode through the newline so a trailing empty line survives splitlines().
+    text = buf[:end].decode("utf-8", errors="replace")
+    del buf[:end]
+    return text
+
+
+def _take_tail(buf: bytearray) -> str:
+    """Return (and clear) a final unterminated line left in `buf`."""
+    if not buf:
+        return ""
+    tail = bytes(buf).decode("utf-8", errors="replace")
+    buf.clear()
+    return tail
+
+
+def _write_test_settings(run_dir: str, payload: dict) -> None:
+    """Write <run_dir>/test_settings.json via tmp + rename (readers never see a partial file)."""
+    outp = os.path.join(run_dir, "test_settings.json")
+    tmp = None
+    try:
+        data = _json_bytes(payload)
+        # Unique tmp name: the RUN MAP and on_finished persists may run concurrently.
+        fd, tmp = tempfile.mkstemp(prefix="test_settings.", suffix=".tmp", dir=run_dir)
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp, outp)
+    except Exception:
+        # best-effort
+        if tmp is not None:
+            try:
+                os.unlink(tmp)
+            except OSError:
+                pass
+
+
+class _PersistRunSignals(QObject):
+    # run_dir, run_window.csv mtime (-1.0 if not there yet)
+    persisted = Signal(str, float)
+
+
+class _PersistRunRunnable(QRunnable):
+    """Persist per-run settings off the UI thread, then report back via a queued signal."""
+
+    def __init__(self, run_dir: str, payload: dict, signals: _PersistRunSignals):
+        super().__init__()
+        self._run_dir = run_dir
+        self._payload = payload
+        self._signals = signals
+
+    def run(self) -> None:
+        st = _stat_or_none(self._run_dir)
+        if st is None or not stat.S_ISDIR(st.st_mode):
+            return
+        if self._payload:
+            _write_test_settings(self._run_dir, self._payload)
+        csv_st = _stat_or_none(os.path.join(self._run_dir, "run_window.csv"))
+        mtime = float(csv_st.st_mtime) if csv_st is not None and stat.S_ISREG(csv_st.st_mode) else -1.0
+        try:
+            self._signals.persisted.emit(self._run_dir, mtime)
+        except RuntimeError:
+            # Controller (and its signals object) already torn down.
+            pass
+
+
 class BenchmarkController:
     """Manages benchmark execution, process control, and results browsing."""
 
+    # Static PowerShell arguments preceding the script path and its parameters.
+    _PS_PREFIX = ("-NoProfile", "-ExecutionPolicy", "Bypass", "-File")
+
     def __init__(
         self,
         parent,
@@ -79,16 +419,54 @@ class BenchmarkController:
         """
         self.parent = parent
         self._log = log_widget
+        self._cap_log_blocks()
         self._run_btn = run_btn
         self._abort_btn = abort_btn
         self._open_btn = open_btn
         self._live_timer = live_timer
         self._remove_btn = remove_btn
         self._compare_btn = compare_btn
+        # Last enabled state pushed to each button (None = not set yet), so selection
+        # churn doesn't re-apply an unchanged state.
+        self._last_remove_enabled: Optional[bool] = None
+        self._last_compare_enabled: Optional[bool] = None
         self._runs_tree = runs_tree
         self._runs_model = runs_model
         self._runs_source_model = runs_source_model
         self._runs_root = runs_root
+        # String form used by the scan, the watcher and its keys (one spelling everywhere).
+        self._runs_root_str = str(runs_root) if runs_root else ""
+        # Resolved once: the runs root doesn't move during a session, and resolve()
+        # is a realpath syscall chain we don't want per selected row.
+        try:
+            self._runs_root_resolved: Optional[Path] = runs_root.resolve() if runs_root else None
+        except Exception:
+            self._runs_root_resolved = None
+        # Normalized "<root><sep>" prefixes (as given and resolved) for string-only
+        # containment checks in _valid_run_dir.
+        prefixes: list[str] = []
+        for r in (runs_root, self._runs_root_resolved):
+            if not r:
+                continue
+            pref = os.path.normcase(os.path.abspath(str(r)))
+            if not pref.endswith(os.sep):
+                pref += os.sep
+            if pref not in prefixes:
+                prefixes.append(pref)
+        self._runs_root_prefix: tuple[str, ...] = tuple(prefixes)
+        # The worker script ships with the app and doesn't move; look it up once.
+        self._run_script = resource_path("cli", "run_case.ps1")
+        self._run_script_exists = self._run_script.exists()
+        # Per-instance abort flag handed to run_case.ps1 (-AbortFlag).
+        self._abort_flag_path = os.path.join(tempfile.gettempdir(), f"thermalbench_abort_{os.getpid()}.flag")
+        # Bumped per run, so a delayed abort fallback can't hit the next run.
+        self._run_seq = 0
+        # (settings key, args) for the launch arguments that only change with settings.
+        self._launch_args_cache: Optional[tuple[tuple, tuple[str, ...]]] = None
+        # Per-instance sensor patterns file (-TempPatternsFile), removed when the run ends.
+        self._patterns_file_path = os.path.join(
+            tempfile.gettempdir(), f"thermalbench_temp_patterns_{os.getpid()}.txt"
+        )
         self._graph_preview = graph_preview
         self._sensor_manager = sensor_manager
 
@@ -97,10 +475,21 @@ class BenchmarkController:
         # (selection highlight) and collapses rapid selection changes into one preview.
         self._pending_preview_target: Optional[str] = None
         self._pending_preview_is_dir: bool = False
-        self._preview_debounce_timer: Optional[QTimer] = None
+        # 0ms single-shot, restarted per selection change => only the last target
+        # within one event-loop turn gets previewed.
+        self._preview_debounce_timer = QTimer(self.parent)
+        self._preview_debounce_timer.setSingleShot(True)
+        self._preview_debounce_timer.setTimerType(Qt.PreciseTimer)
+        self._preview_debounce_timer.timeout.connect(self._apply_pending_preview_target)
         self._save_settings = save_settings_callback
         self._get_settings = get_settings_callback
         self._append_log = append_log_callback
+        # Raw process output not yet terminated by a newline (carried to the next read).
+        self._stdout_buf = bytearray()
+        self._stderr_buf = bytearray()
+        # Process output lines waiting to be written to the log in one batch.
+        self._log_pending: list[str] = []
+        self._log_flush_scheduled = False
         self._on_run_started = on_run_started
         self._on_run_finished = on_run_finished
         self._on_log_started = on_log_started
@@ -114,16 +503,50 @@ class BenchmarkController:
         self._latest_cached_folder: Optional[Path] = None
         self._latest_cached_mtime: float = 0.0
         self._latest_cached_at_ts: float = 0.0
-        self._latest_scan_cooldown_sec: float = 5.0
+        # Set whenever something may have produced/removed results (run finished,
+        # runs folder changed on disk). Scans only happen while dirty.
+        self._latest_cache_dirty: bool = True
+        # case folder path -> (case mtime, newest run path or None, its result mtime)
+        self._case_dir_mtime_cache: dict[str, tuple[float, Optional[str], float]] = {}
+        # Case folders reported changed since the last scan; None = rescan everything
+        # (runs root changed, or no scan yet). Cases with a run still in progress are
+        # never cached, so they are rescanned every time.
+        self._latest_dirty_cases: Optional[set[str]] = None
+        self._incomplete_cases: set[str] = set()
+        # Seed the per-case cache from the previous session so the first scan after
+        # launch only stats case folders instead of descending into every run.
+        self._load_latest_cache_sidecar()
+
+        # Watch only the runs root (case folders added/removed/renamed) so the latest-folder
+        # cache is invalidated on change instead of being re-validated by periodic rescans.
+        # Case folders aren't watched: on Windows a watch holds a directory handle, which
+        # would block renaming or deleting cases from Explorer. Runs finished here
+        # invalidate their case directly (on_finished).
+        try:
+            self._fs_watcher = QFileSystemWatcher(self.parent)
+            self._fs_watcher.directoryChanged.connect(self._on_runs_dir_changed)
+        except Exception:
+            self._fs_watcher = None
+
+        # Folder whose ancestors select_latest_result last expanded (skip re-walking).
+        self._last_expanded_target: Optional[str] = None
+        # (target path, its _norm_path) for the current-selection check in select_latest_result.
+        self._latest_target_norm: Optional[tuple[str, str]] = None
 
         # Remember last user-selected path (if user clicked something in the tree)
         self._last_selected_path: Optional[Path] = None
 
         # Compare selection + popup
         self._compare_selected_dirs: set[Path] = set()
+        # Name-sorted view of _compare_selected_dirs; None => rebuild on next use.
+        # Reset wherever the set is mutated.
+        self._compare_sorted_cache: Optional[list[Path]] = None
         self._compare_restoring = False
         self._compare_popup: Optional[ComparePopup] = None
         self._compare_dim_overlay: Optional[DimOverlay] = None
+        # Geometry last applied to the overlay; setGeometry is skipped when unchanged
+        # (it costs a resize event + full repaint of the dimmed area).
+        self._compare_overlay_last_rect: Optional[QRect] = None
 
         # Process for running benchmarks
         try:
@@ -139,11 +562,23 @@ class BenchmarkController:
 
         # Live timer
         self._timer = QTimer(self.parent)
-        self._timer.setInterval(250)
+        # MM:SS display: each tick re-arms the timer for the moment the shown second
+        # changes (see _tick_timer), so the label updates once per second on time.
+        self._timer.setSingleShot(True)
+        self._timer.setTimerType(Qt.PreciseTimer)
         self._timer.timeout.connect(self._tick_timer)
+        # Countdown runs on absolute time.monotonic() deadlines (None = not running);
+        # _run_started_at is kept only for the wall-clock timestamps in on_finished;
+        # elapsed time comes from the monotonic start.
+        self._warmup_end: Optional[float] = None
+        self._log_end: Optional[float] = None
         self._run_started_at = None
+        self._run_started_mono: Optional[float] = None
         self._warmup_total = 0
         self._log_total = 0
+        # Last (phase, remaining seconds) shown; ticks that land in the same second
+        # return before formatting / setText (which would repaint the label).
+        self._last_tick_key: Optional[tuple[str, int]] = None
 
         # Pending timer values (set when process starts)
         self._pending_warm = 0
@@ -152,6 +587,10 @@ class BenchmarkController:
 
         # Pending per-run settings (persisted into the run folder once known)
         self._pending_run_settings: dict = {}
+        # File I/O for the run folder happens on the global QThreadPool; results
+        # come back to the UI thread through this queued signal.
+        self._persist_signals = _PersistRunSignals()
+        self._persist_signals.persisted.connect(self._on_run_persisted, Qt.QueuedConnection)
 
         # Connect results tree selection
         try:
@@ -164,35 +603,33 @@ class BenchmarkController:
         except Exception:
             pass
 
+        # proxy (row, column, internalId) -> file path. Selection handlers resolve the
+        # same index several times per event; any model change drops the cache.
+        self._idx_path_cache: dict[tuple[int, int, int], str] = {}
+        # Reverse direction for the few most recent targets (Results-tab switches keep
+        # asking for the same latest run); dropped together with the cache above.
+        self._path_idx_cache: dict[str, object] = {}
+        try:
+            for sig in (
+                self._runs_model.modelReset,
+                self._runs_model.layoutChanged,
+                self._runs_model.rowsInserted,
+                self._runs_model.rowsRemoved,
+                self._runs_model.rowsMoved,
+                self._runs_model.dataChanged,  # renames keep the row but change the path
+            ):
+                sig.connect(self._clear_idx_path_cache)
+        except Exception:
+            pass
+
         self._update_remove_btn_state()
         self._update_compare_btn_state()
 
     def _schedule_preview_target(self, *, fpath: str, is_dir: bool) -> None:
-        try:
-            self._pending_preview_target = str(fpath)
-            self._pending_preview_is_dir = bool(is_dir)
-
-            if self._preview_debounce_timer is None:
-                t = QTimer(self.parent)
-                t.setSingleShot(True)
-                try:
-                    t.setTimerType(Qt.PreciseTimer)
-                except Exception:
-                    pass
-                t.timeout.connect(self._apply_pending_preview_target)
-                self._preview_debounce_timer = t
-
-            # 0ms => next event-loop turn (lets selection paint first)
-            self._preview_debounce_timer.start(0)
-        except Exception:
-            # Fallback: run immediately
-            try:
-                if is_dir:
-                    self._graph_preview.preview_folder(str(fpath))
-                else:
-                    self._graph_preview.preview_path(str(fpath))
-            except Exception:
-                pass
+        self._pending_preview_target = str(fpath)
+        self._pending_preview_is_dir = bool(is_dir)
+        # 0ms => next event-loop turn (lets selection paint first)
+        self._preview_debounce_timer.start(0)
 
     def _apply_pending_preview_target(self) -> None:
         tgt = None
@@ -230,21 +667,7 @@ class BenchmarkController:
             if not fpath:
                 return None
 
-            p = Path(fpath)
-            run_dir = p if p.is_dir() else p.parent
-            if not run_dir.exists() or not run_dir.is_dir():
-                return None
-
-            try:
-                root = self._runs_root.resolve()
-                run_dir.resolve().relative_to(root)
-            except Exception:
-                return None
-
-            if not _RUN_FOLDER_RE.match(run_dir.name):
-                return None
-
-            return run_dir
+            return _valid_run_dir(str(fpath), self._runs_root_prefix)
         except Exception:
             return None
 
@@ -258,14 +681,9 @@ class BenchmarkController:
             try:
                 rows = sm.selectedRows(0)
             except Exception:
-                rows = [i for i in sm.selectedIndexes() if getattr(i, "column", lambda: 0)() == 0]
+                rows = [i for i in sm.selectedIndexes() if i.column() == 0]
 
-            out: set[Path] = set()
-            for idx in rows:
-                rd = self._run_folder_from_index(idx)
-                if rd is not None:
-                    out.add(rd)
-            return out
+            return {rd for rd in map(self._run_folder_from_index, rows) if rd is not None}
         except Exception:
             return set()
 
@@ -282,24 +700,27 @@ class BenchmarkController:
             return
 
         self._compare_restoring = True
+        prev_suppress = self._suppress_selection_preview
+        self._suppress_selection_preview = True
         try:
-            try:
-                sm.clearSelection()
-            except Exception:
-                try:
-                    sm.clear()
-                except Exception:
-                    pass
-
-            for run_dir in sorted(self._compare_selected_dirs, key=lambda p: p.name):
+            # Collect everything into one selection so the model emits a single
+            # selectionChanged (one repaint / preview scheduling) instead of N.
+            sel = QItemSelection()
+            for run_dir in self._sorted_compare_dirs():
                 idx = self._path_to_proxy_index(str(run_dir))
                 if idx is None or (hasattr(idx, "isValid") and not idx.isValid()):
                     continue
+                sel.append(QItemSelectionRange(idx, idx))
+
+            try:
+                sm.select(sel, QItemSelectionModel.ClearAndSelect | QItemSelectionModel.Rows)
+            except Exception:
                 try:
-                    sm.select(idx, QItemSelectionModel.Select | QItemSelectionModel.Rows)
+                    sm.clearSelection()
                 except Exception:
                     pass
         finally:
+            self._suppress_selection_preview = prev_suppress
             self._compare_restoring = False
 
     def _update_compare_btn_state(self) -> None:
@@ -310,7 +731,11 @@ class BenchmarkController:
             # Guard: don't allow comparing already-compared results.
             # Compare-result folders are created by this app and contain compare_manifest.json.
             valid = [p for p in (self._compare_selected_dirs or set()) if not self._is_compare_result_dir(p)]
-            self._compare_btn.setEnabled(len(valid) >= 2)
+            enabled = len(valid) >= 2
+            if enabled == self._last_compare_enabled:
+                return
+            self._compare_btn.setEnabled(enabled)
+            self._last_compare_enabled = enabled
         except Exception:
             pass
 
@@ -328,7 +753,7 @@ class BenchmarkController:
             return False
 
     @staticmethod
-    def _sort_sensors_for_compare(sensors: list[str], group_map: dict[str, str] | None = None) -> list[str]:
+    def _sort_sensors_for_compare(sensors: list[str], group_map: Mapping[str, str] | None = None) -> list[str]:
         """Sort sensor column names for compare plotting.
 
         Ordering:
@@ -337,58 +762,29 @@ class BenchmarkController:
         3) Finally, stable alphabetical by sensor name
         """
 
-        gm = dict(group_map or {})
-
-        type_prio = {
-            "Temperature": 0,
-            "Power (W)": 1,
-            "RPM": 2,
-            "Voltage (V)": 3,
-            "Percentage (%)": 4,
-            "Clock (MHz)": 5,
-            "Timing (T)": 6,
-        }
+        # Only read via .get(); no need to copy.
+        gm = group_map or {}
 
-        def _bucket_text(name: str) -> str:
-            # Use both the column name and its HWiNFO group title for better classification.
+        def _sort_key(name: str):
             try:
                 grp = str(gm.get(name) or "")
             except Exception:
                 grp = ""
-            return f"{name} {grp}".lower()
-
-        def _device_subprio(name: str) -> int:
-            t = _bucket_text(name)
-            # CPU-ish
-            if "cpu" in t or "package" in t or "ccd" in t or "tctl" in t:
-                return 0
-            # GPU-ish
-            if "gpu" in t:
-                return 1
-            # Ambient
-            if "ambient" in t or "room" in t:
-                return 2
-            return 3
-
-        def _type_label(name: str) -> str:
-            try:
-                unit = extract_unit_from_column(name)
-                return str(get_measurement_type_label(unit))
-            except Exception:
-                return "[other]"
-
-        def _sort_key(name: str):
-            tl = _type_label(name)
-            return (
-                int(type_prio.get(tl, 99)),
-                int(_device_subprio(name)),
-                str(name).lower(),
-            )
+            return _compare_sort_key(name, grp)
 
+        names = [str(s) for s in (sensors or []) if str(s).strip()]
         try:
-            return sorted([str(s) for s in (sensors or []) if str(s).strip()], key=_sort_key)
+            return sorted(names, key=_sort_key)
         except Exception:
-            return [str(s) for s in (sensors or []) if str(s).strip()]
+            return names
+
+    def _sorted_compare_dirs(self) -> list[Path]:
+        """Compare-selected run folders ordered by name (cached until the set changes)."""
+        cached = self._compare_sorted_cache
+        if cached is None:
+            cached = sorted(self._compare_selected_dirs, key=operator.attrgetter("name"))
+            self._compare_sorted_cache = cached
+        return list(cached)
 
     def toggle_compare_selection_for_index(self, idx) -> None:
         """Double-click handler: toggles a run folder in the compare selection set."""
@@ -401,6 +797,7 @@ class BenchmarkController:
         if self._is_compare_result_dir(run_dir):
             try:
                 self._compare_selected_dirs.discard(run_dir)
+                self._compare_sorted_cache = None
             except Exception:
                 pass
             self._apply_compare_selection_to_view()
@@ -408,6 +805,7 @@ class BenchmarkController:
             return
 
         try:
+            self._compare_sorted_cache = None
             if run_dir in self._compare_selected_dirs:
                 self._compare_selected_dirs.remove(run_dir)
             else:
@@ -429,9 +827,13 @@ class BenchmarkController:
                 except Exception:
                     pass
                 self._compare_dim_overlay = DimOverlay(top, on_click=self._close_compare_popup)
+                self._compare_overlay_last_rect = None
 
             try:
-                self._compare_dim_overlay.setGeometry(top.rect())
+                rect = top.rect()
+                if rect != self._compare_overlay_last_rect:
+                    self._compare_dim_overlay.setGeometry(rect)
+                    self._compare_overlay_last_rect = rect
             except Exception:
                 pass
         except Exception:
@@ -466,33 +868,31 @@ class BenchmarkController:
             if len(self._compare_selected_dirs) < 2:
                 return
 
-            run_dirs = list(sorted(self._compare_selected_dirs, key=lambda p: p.name))
+            run_dirs = self._sorted_compare_dirs()
 
             sensor_sets: list[set[str]] = []
             for rd in run_dirs:
-                csvp = rd / "run_window.csv"
-                if not csvp.exists():
-                    sensor_sets.append(set())
-                    continue
                 try:
-                    _df, cols = load_run_csv_dataframe(str(csvp))
-                    sensor_sets.append(set(cols or []))
+                    sensor_sets.append(set(_run_csv_sensor_columns(rd / "run_window.csv")))
                 except Exception:
                     sensor_sets.append(set())
 
+            # Seed with the smallest set and stop as soon as nothing is shared.
             common: set[str] = set()
             if sensor_sets:
-                common = set.intersection(*sensor_sets) if sensor_sets else set()
+                sensor_sets.sort(key=len)
+                common = sensor_sets[0].copy()
+                for other in sensor_sets[1:]:
+                    if not common:
+                        break
+                    common &= other
 
             title = f"Compare ({len(run_dirs)} results)"
 
             # Best-effort: group sensors by their HWiNFO device group (cached from SM2).
             # This is the same device grouping used by the sensor picker dialogs.
-            group_map: dict[str, str] = {}
             try:
-                payload = load_sensor_map(resource_path("resources", "sensor_map.json"))
-                if isinstance(payload, dict) and payload.get("schema") == 1:
-                    group_map = dict(payload.get("mapping") or {})
+                group_map = _cached_group_map()
             except Exception:
                 group_map = {}
 
@@ -534,15 +934,11 @@ class BenchmarkController:
 
             # Sort sensors so compare plots are consistently ordered.
             try:
-                group_map: dict[str, str] = {}
-                payload = load_sensor_map(resource_path("resources", "sensor_map.json"))
-                if isinstance(payload, dict) and payload.get("schema") == 1:
-                    group_map = dict(payload.get("mapping") or {})
-                sensors = self._sort_sensors_for_compare(sensors, group_map=group_map)
+                sensors = self._sort_sensors_for_compare(sensors, group_map=_cached_group_map())
             except Exception:
                 sensors = self._sort_sensors_for_compare(sensors)
 
-            run_dirs = list(sorted(self._compare_selected_dirs, key=lambda p: p.name))
+            run_dirs = self._sorted_compare_dirs()
             if len(run_dirs) < 2:
                 return
 
@@ -554,29 +950,17 @@ class BenchmarkController:
 
             def _stress_label(rd: Path) -> str:
                 """Return CPU/GPU/CPUGPU, best-effort."""
-                try:
-                    m = re.match(r"^(CPU|GPU|CPUGPU)_W\d+_L\d+_V\d+$", str(rd.name), flags=re.IGNORECASE)
-                    if m:
-                        return str(m.group(1)).upper()
-                except Exception:
-                    pass
+                kind = _stress_kind_from_name(str(rd.name))
+                if kind:
+                    return kind
 
                 # Fallback: try test_settings.json (older/different naming)
+                p = os.path.join(str(rd), "test_settings.json")
                 try:
-                    p = rd / "test_settings.json"
-                    if p.exists():
-                        s = json.loads(p.read_text(encoding="utf-8"))
-                        sm = str((s or {}).get("stress_mode") or "").upper()
-                        if "CPU" in sm and "GPU" in sm:
-                            return "CPUGPU"
-                        if "GPU" in sm:
-                            return "GPU"
-                        if "CPU" in sm:
-                            return "CPU"
-                except Exception:
-                    pass
-
-                return "CPU"
+                    mtime_ns = os.stat(p).st_mtime_ns
+                except OSError:
+                    return "CPU"
+                return _stress_kind_from_settings(p, mtime_ns) or "CPU"
 
             def _compare_run_dir_name(rd_a: Path, rd_b: Path) -> str:
                 a_case = _case_label(rd_a)
@@ -613,6 +997,7 @@ class BenchmarkController:
                     i += 1
 
             out_run_dir.mkdir(parents=True, exist_ok=True)
+            self._invalidate_latest_cache(self._case_key_for_run(str(out_run_dir)))
 
             # Store run paths relative to runs root so previews are portable.
             runs_rel: list[str] = []
@@ -633,7 +1018,10 @@ class BenchmarkController:
 
             mpath = out_run_dir / "compare_manifest.json"
             try:
-                mpath.write_text(json.dumps(manifest, indent=2), encoding="utf-8")
+                if orjson is not None:
+                    mpath.write_bytes(orjson.dumps(manifest, option=orjson.OPT_INDENT_2))
+                else:
+                    mpath.write_text(json.dumps(manifest, separators=(",", ":")), encoding="utf-8")
             except Exception:
                 # keep going; preview will fail gracefully
                 pass
@@ -652,6 +1040,7 @@ class BenchmarkController:
                 self._compare_selected_dirs.clear()
             except Exception:
                 self._compare_selected_dirs = set()
+            self._compare_sorted_cache = None
             self._update_compare_btn_state()
 
             # Select and preview the new compare run
@@ -686,31 +1075,52 @@ class BenchmarkController:
     # -------------------------------------------------------------------------
     # index -> filesystem path helpers (proxy-safe)
     # -------------------------------------------------------------------------
+    def _clear_idx_path_cache(self, *_args) -> None:
+        self._idx_path_cache.clear()
+        self._path_idx_cache.clear()
+
     def _idx_to_path(self, idx) -> str:
         try:
             if idx is None or (hasattr(idx, "isValid") and not idx.isValid()):
                 return ""
+            key = (idx.row(), idx.column(), idx.internalId())
+            cached = self._idx_path_cache.get(key)
+            if cached is not None:
+                return cached
+            path = ""
             # if proxy, map to source
             if hasattr(self._runs_model, "mapToSource") and self._runs_source_model is not None:
                 src_idx = self._runs_model.mapToSource(idx)
-                return self._runs_source_model.filePath(src_idx)
+                path = self._runs_source_model.filePath(src_idx)
             # if direct fs model
-            if hasattr(self._runs_model, "filePath"):
-                return self._runs_model.filePath(idx)
+            elif hasattr(self._runs_model, "filePath"):
+                path = self._runs_model.filePath(idx)
+            if path:
+                if len(self._idx_path_cache) >= 64:
+                    self._idx_path_cache.clear()
+                self._idx_path_cache[key] = path
+            return path
         except Exception:
             return ""
-        return ""
 
     def _path_to_proxy_index(self, path: str):
         try:
             if self._runs_source_model is None:
                 return None
-            src_idx = self._runs_source_model.index(str(path))
+            key = str(path)
+            cached = self._path_idx_cache.get(key)
+            if cached is not None and cached.isValid():
+                return cached
+            src_idx = self._runs_source_model.index(key)
             if not src_idx.isValid():
                 return None
-            if hasattr(self._runs_model, "mapFromSource"):
-                return self._runs_model.mapFromSource(src_idx)
-            return src_idx
+            idx = self._runs_model.mapFromSource(src_idx) if hasattr(self._runs_model, "mapFromSource") else src_idx
+            if idx.isValid():
+                if len(self._path_idx_cache) >= 8:
+                    # Evict the oldest entry (dicts keep insertion order).
+                    del self._path_idx_cache[next(iter(self._path_idx_cache))]
+                self._path_idx_cache[key] = idx
+            return idx
         except Exception:
             return None
 
@@ -722,22 +1132,8 @@ class BenchmarkController:
             if not fpath:
                 return None
 
-            p = Path(fpath)
-            run_dir = p if p.is_dir() else p.parent
-            if not run_dir.exists() or not run_dir.is_dir():
-                return None
-
             # Ensure inside runs root and shaped like a run folder
-            try:
-                root = self._runs_root.resolve()
-                run_dir.resolve().relative_to(root)
-            except Exception:
-                return None
-
-            if not _RUN_FOLDER_RE.match(run_dir.name):
-                return None
-
-            return run_dir
+            return _valid_run_dir(str(fpath), self._runs_root_prefix)
         except Exception:
             return None
 
@@ -746,122 +1142,338 @@ class BenchmarkController:
             if self._remove_btn is None:
                 return
             has_any = bool(self._selected_run_folders()) or (self._current_run_folder() is not None)
+            if has_any == self._last_remove_enabled:
+                return
             self._remove_btn.setEnabled(has_any)
+            self._last_remove_enabled = has_any
         except Exception:
             pass
 
     # -------------------------------------------------------------------------
     # Latest-result discovery (FAST, cached)
     # -------------------------------------------------------------------------
+    @staticmethod
+    def _scan_case_for_latest_run(case_path: str) -> tuple[Optional[str], float, bool]:
+        """
+        Scan one case folder for its newest run:
+          <case>/<runId>/(run_window.csv OR ALL_SELECTED.png)
+
+        Returns (run_dir_path, result_mtime, complete). `complete` is False when some
+        run folder has no result file yet (run still in progress): its files can
+        appear later without touching the case folder mtime, so the result must not
+        be cached against that mtime.
+        """
+        best_run = None
+        best_mtime = -1.0
+        complete = True
+        # Locals for the per-run loop (runs once per run folder of every changed case).
+        scandir = os.scandir
+        scan_names = _RUN_SCAN_NAMES
+
+        try:
+            with scandir(case_path) as runs:
+                for run_ent in runs:
+                    if not run_ent.is_dir(follow_symlinks=False):
+                        continue
+
+                    csv_ent = None
+                    png_ent = None
+                    finished = False
+                    try:
+                        with scandir(run_ent.path) as files:
+                            for f in files:
+                                name = f.name
+                                if name not in scan_names:
+                                    continue
+                                if name == "run_window.csv":
+                                    if f.is_file(follow_symlinks=False):
+                                        csv_ent = f
+                                        break
+                                elif name == "ALL_SELECTED.png":
+                                    if f.is_file(follow_symlinks=False):
+                                        png_ent = f
+                                elif name == "compare_manifest.json":
+                                    finished = True
+                    except OSError:
+                        continue
+
+                    ent = csv_ent or png_ent
+                    if ent is None:
+                        if not finished:
+                            complete = False
+                        continue
+
+                    try:
+                        mt = ent.stat(follow_symlinks=False).st_mtime
+                    except OSError:
+                        continue
+                    if mt > best_mtime:
+                        best_mtime = mt
+                        best_run = run_ent.path
+        except OSError:
+            return None, -1.0, False
+
+        return best_run, best_mtime, complete
+
     def _fast_find_latest_result_folder(self) -> Optional[Path]:
         """
         Fast scan for latest run folder:
           runs/<case>/<runId>/(run_window.csv OR ALL_SELECTED.png)
 
-        Uses scandir (2-level) instead of rglob (recursive).
+        Uses scandir (2-level) instead of rglob (recursive). Case folders whose
+        mtime is unchanged since the previous scan reuse their cached newest run
+        instead of being descended into again. When only individual case folders
+        were invalidated, just those (plus cases with a run in progress) are
+        revisited.
         """
         root = self._runs_root
         if not root or not root.exists():
             return None
 
-        best_folder = None
-        best_mtime = -1.0
+        root_str = self._runs_root_str
+        self._watch_runs_dirs([root_str])
 
-        try:
-            for case_ent in os.scandir(str(root)):
-                if not case_ent.is_dir():
-                    continue
+        case_cache = self._case_dir_mtime_cache
+        # Newest run of each case that couldn't be cached (run in progress).
+        fresh: dict[str, tuple[Optional[str], float]] = {}
 
-                try:
-                    for run_ent in os.scandir(case_ent.path):
-                        if not run_ent.is_dir():
+        try:
+            # A scan requested while nothing was invalidated (e.g. the cached folder
+            # vanished) re-lists everything.
+            dirty = self._latest_dirty_cases if self._latest_cache_dirty else None
+            if dirty is None:
+                seen_cases: set[str] = set()
+                with os.scandir(root_str) as cases:
+                    for case_ent in cases:
+                        if not case_ent.is_dir(follow_symlinks=False):
+                            continue
+                        try:
+                            case_mtime = case_ent.stat(follow_symlinks=False).st_mtime
+                        except OSError:
                             continue
+                        seen_cases.add(case_ent.path)
+                        self._refresh_case_cache(case_ent.path, case_mtime, fresh)
 
-                        run_dir = Path(run_ent.path)
+                # Forget case folders that no longer exist.
+                for stale in [k for k in case_cache if k not in seen_cases]:
+                    del case_cache[stale]
+            else:
+                # Only some case folders changed (the root didn't): every other case
+                # keeps its cached newest run without being listed or stat'ed.
+                for case_path in dirty | self._incomplete_cases:
+                    st = _stat_or_none(case_path)
+                    if st is None or not stat.S_ISDIR(st.st_mode):
+                        case_cache.pop(case_path, None)
+                        continue
+                    self._refresh_case_cache(case_path, st.st_mtime, fresh)
 
-                        csvp = run_dir / "run_window.csv"
-                        if csvp.is_file():
-                            try:
-                                mt = csvp.stat().st_mtime
-                                if mt > best_mtime:
-                                    best_mtime = mt
-                                    best_folder = run_dir
-                                continue
-                            except Exception:
-                                pass
+        except Exception:
+            return None
 
-                        pngp = run_dir / "ALL_SELECTED.png"
-                        if pngp.is_file():
-                            try:
-                                mt = pngp.stat().st_mtime
-                                if mt > best_mtime:
-                                    best_mtime = mt
-                                    best_folder = run_dir
-                            except Exception:
-                                pass
+        self._incomplete_cases = set(fresh)
+        self._latest_dirty_cases = set()
+        self._latest_cache_dirty = False
 
-                except Exception:
-                    continue
+        best_folder = None
+        best_mtime = -1.0
+        for case_best, case_best_mtime in chain(
+            ((hit[1], hit[2]) for hit in case_cache.values()), fresh.values()
+        ):
+            if case_best is not None and case_best_mtime > best_mtime:
+                best_mtime = case_best_mtime
+                best_folder = case_best
 
-        except Exception:
+        if best_folder is None or best_mtime < 0:
+            self._latest_cached_folder = None
+            self._save_latest_cache_sidecar()
             return None
 
-        if best_folder is not None and best_mtime >= 0:
-            self._latest_cached_folder = best_folder
-            self._latest_cached_mtime = float(best_mtime)
-            self._latest_cached_at_ts = time.time()
+        best_path = Path(best_folder)
+        self._latest_cached_folder = best_path
+        self._latest_cached_mtime = float(best_mtime)
+        self._latest_cached_at_ts = time.time()
+        self._save_latest_cache_sidecar()
+        return best_path
 
-        return best_folder
+    @staticmethod
+    def _latest_cache_sidecar_path() -> Path:
+        # Kept next to settings.json rather than inside runs_root: writing into the
+        # runs folder would bump the very mtime it is keyed on and wake the watcher.
+        return get_settings_path().with_name("latest_cache.json")
 
-    def _get_cached_latest_folder(self) -> Optional[Path]:
-        """
-        Return cached latest folder if available and still exists.
-        Re-scan only if cache is empty/stale and cooldown passed.
-        """
+    def _load_latest_cache_sidecar(self) -> None:
+        """Restore the per-case latest-run cache persisted by the previous session."""
         try:
-            if self._latest_cached_folder is not None and self._latest_cached_folder.exists():
-                return self._latest_cached_folder
+            root = self._runs_root
+            if not root:
+                return
+            payload = load_json(self._latest_cache_sidecar_path())
+            if payload.get("runs_root") != str(root):
+                return
+            if payload.get("root_mtime_ns") != os.stat(str(root)).st_mtime_ns:
+                return
+            cases = payload.get("cases") or {}
+            for case_path, (case_mtime, best, best_mtime) in cases.items():
+                self._case_dir_mtime_cache[str(case_path)] = (
+                    float(case_mtime),
+                    str(best) if best else None,
+                    float(best_mtime),
+                )
+        except Exception:
+            self._case_dir_mtime_cache.clear()
+
+    def _save_latest_cache_sidecar(self) -> None:
+        try:
+            root = self._runs_root
+            if not root:
+                return
+            save_json(
+                self._latest_cache_sidecar_path(),
+                {
+                    "runs_root": str(root),
+                    "root_mtime_ns": os.stat(str(root)).st_mtime_ns,
+                    "folder": str(self._latest_cached_folder) if self._latest_cached_folder else None,
+                    "mtime": float(self._latest_cached_mtime),
+                    "cases": {k: list(v) for k, v in self._case_dir_mtime_cache.items()},
+                },
+            )
         except Exception:
             pass
 
-        now = time.time()
-        if (now - float(self._latest_cached_at_ts or 0.0)) < float(self._latest_scan_cooldown_sec or 5.0):
+    def _refresh_case_cache(
+        self, case_path: str, case_mtime: float, fresh: dict[str, tuple[Optional[str], float]]
+    ) -> None:
+        """Rescan one case folder unless its cached entry matches `case_mtime`."""
+        case_cache = self._case_dir_mtime_cache
+        hit = case_cache.get(case_path)
+        if hit is not None and hit[0] == case_mtime:
+            return
+        case_best, case_best_mtime, complete = self._scan_case_for_latest_run(case_path)
+        if complete:
+            case_cache[case_path] = (case_mtime, case_best, case_best_mtime)
+        else:
+            case_cache.pop(case_path, None)
+            fresh[case_path] = (case_best, case_best_mtime)
+
+    def _case_key_for_run(self, run_dir: str) -> Optional[str]:
+        """Case folder of `run_dir` spelled like the scan's keys, or None if not under runs_root."""
+        try:
+            root = self._runs_root_str
+            case_dir = os.path.dirname(os.path.normpath(run_dir))
+            if os.path.normcase(os.path.dirname(case_dir)) != os.path.normcase(os.path.normpath(root)):
+                return None
+            return os.path.join(root, os.path.basename(case_dir))
+        except Exception:
+            return None
+
+    def _get_cached_latest_folder(self) -> Optional[Path]:
+        """
+        Return the cached latest folder while nothing has changed on disk.
+        Re-scan only after an invalidation (run finished / watcher fired).
+        """
+        if self._latest_cache_dirty:
+            return self._fast_find_latest_result_folder()
+
+        cached = self._latest_cached_folder
+        if cached is None:
             return None
+        # One stat as a guard: removing a run folder inside a case isn't seen by the
+        # root-only watcher.
+        if _stat_or_none(cached) is not None:
+            return cached
+        self._invalidate_latest_cache()
+        return None
+
+    def _invalidate_latest_cache(self, case_path: Optional[str] = None) -> None:
+        """Mark the latest folder stale; `case_path` limits the next scan to that case."""
+        self._latest_cache_dirty = True
+        self._latest_cached_folder = None
+        if case_path is not None:
+            # Re-running into an existing run folder rewrites run_window.csv without
+            # touching the case folder's mtime, so the entry can't be trusted either.
+            self._case_dir_mtime_cache.pop(case_path, None)
+        if case_path is None or self._latest_dirty_cases is None:
+            self._latest_dirty_cases = None
+        else:
+            self._latest_dirty_cases.add(case_path)
+
+    def invalidate_latest_result(self) -> None:
+        """Drop the cached latest run after the app itself reshaped the runs tree.
+
+        The watcher would notice too, but only asynchronously; a select_latest_result
+        queued right after the change must not get the old (possibly deleted) folder.
+        """
+        self._invalidate_latest_cache()
+
+    def _on_runs_dir_changed(self, path: str) -> None:
+        # Only the runs root is watched: a case folder appeared, vanished or was renamed.
+        self._invalidate_latest_cache()
 
-        return self._fast_find_latest_result_folder()
+    def _watch_runs_dirs(self, paths) -> None:
+        """Add directories to the runs watcher (best-effort, skips already-watched)."""
+        if self._fs_watcher is None:
+            return
+        try:
+            watched = set(self._fs_watcher.directories())
+            new = [p for p in paths if p not in watched]
+            if new:
+                self._fs_watcher.addPaths(new)
+        except Exception:
+            pass
 
     # -------------------------------------------------------------------------
     # Live Timer
     # -------------------------------------------------------------------------
     @staticmethod
     def _fmt_mmss(total_seconds: int) -> str:
-        total_seconds = max(0, total_seconds)
-        return f"{total_seconds//60:02d}:{total_seconds%60:02d}"
+        return _fmt_mmss(max(0, total_seconds))
 
     def start_live_timer(self, warmup_sec: int, log_sec: int):
         self._warmup_total = warmup_sec
         self._log_total = log_sec
         self._run_started_at = datetime.now()
+        t0 = time.monotonic()
+        self._run_started_mono = t0
+        self._warmup_end = t0 + warmup_sec
+        self._log_end = self._warmup_end + log_sec
+        self._last_tick_key = None
         self._tick_timer()
-        self._timer.start()
 
     def stop_live_timer(self, final_text: str = "Idle"):
         self._timer.stop()
         self._run_started_at = None
+        self._run_started_mono = None
+        self._warmup_end = None
+        self._log_end = None
+        self._last_tick_key = None
         self._live_timer.setText(final_text)
 
     def _tick_timer(self):
-        if not self._run_started_at:
+        warmup_end = self._warmup_end
+        if warmup_end is None:
             return
-        elapsed = int((datetime.now() - self._run_started_at).total_seconds())
-        if elapsed < self._warmup_total:
-            self._live_timer.setText(f"Warmup  {self._fmt_mmss(self._warmup_total - elapsed)}")
+        now = time.monotonic()
+        # ceil: show the full duration at the start and reach 00:00 at the deadline.
+        if now < warmup_end:
+            remaining = warmup_end - now
+            key = ("Warmup", math.ceil(remaining))
+        elif now < self._log_end:
+            remaining = self._log_end - now
+            key = ("Log", math.ceil(remaining))
+        else:
+            remaining = None
+            key = ("Done", 0)
+
+        # Next tick when ceil(remaining) drops, i.e. after its fractional part (or
+        # a full second on an exact boundary). Nothing changes after "Done".
+        if remaining is not None:
+            frac = remaining - math.floor(remaining) or 1.0
+            self._timer.start(math.ceil(frac * 1000))
+
+        if key == self._last_tick_key:
             return
-        log_elapsed = elapsed - self._warmup_total
-        if log_elapsed < self._log_total:
-            self._live_timer.setText(f"Log  {self._fmt_mmss(self._log_total - log_elapsed)}")
-            return
-        self._live_timer.setText("Done  00:00")
+        self._last_tick_key = key
+        self._live_timer.setText(_timer_label(*key))
 
     # -------------------------------------------------------------------------
     # Results Browser
@@ -896,7 +1508,7 @@ class BenchmarkController:
 
                 # If user selected a run folder directly.
                 try:
-                    if pr.is_dir() and _RUN_FOLDER_RE.match(pr.name):
+                    if pr.is_dir() and _is_run_folder_name(pr.name):
                         rel = str(pr.relative_to(root_r)).replace("\\", "/")
                         out.add(rel)
                         continue
@@ -911,7 +1523,7 @@ class BenchmarkController:
                                 if not ent.is_dir():
                                     continue
                                 rd = Path(ent.path)
-                                if not _RUN_FOLDER_RE.match(rd.name):
+                                if not _is_run_folder_name(rd.name):
                                     continue
                                 try:
                                     rel = str(rd.resolve().relative_to(root_r)).replace("\\", "/")
@@ -1119,16 +1731,11 @@ class BenchmarkController:
         try:
             lines: list[str] = []
 
-            def _is_run_folder(p: Path) -> bool:
-                try:
-                    return bool(p is not None and p.is_dir() and _RUN_FOLDER_RE.match(p.name))
-                except Exception:
-                    return False
-
-            def _list_tree_children(dir_path: Path) -> list[str]:
+            def _list_tree_children(dir_path: Path, name: str) -> list[str]:
                 """Return immediate child names as shown in the tree."""
                 try:
-                    if _is_run_folder(dir_path):
+                    # Run folders are leaves in the tree.
+                    if _is_run_folder_name(name):
                         return []
                     out: list[str] = []
                     with os.scandir(str(dir_path)) as it:
@@ -1148,13 +1755,15 @@ class BenchmarkController:
                 except Exception:
                     continue
 
-                if not p.exists():
+                st = _stat_or_none(p)
+                if st is None:
                     continue
 
-                if p.is_dir():
-                    lines.append(f"{p.name}")
+                name = p.name
+                if stat.S_ISDIR(st.st_mode):
+                    lines.append(name)
 
-                    children = _list_tree_children(p)
+                    children = _list_tree_children(p, name)
                     if not children:
                         # Mirror tree semantics: empty (or run folder leaf)
                         lines.append("  (empty)")
@@ -1163,7 +1772,7 @@ class BenchmarkController:
                             lines.append(f"  {name}")
                 else:
                     # For single-file deletes, show only the file name (no contents).
-                    lines.append(str(p.name))
+                    lines.append(name)
 
             return "\n".join(lines).strip()
         except Exception:
@@ -1231,6 +1840,10 @@ class BenchmarkController:
 
     def _on_runs_current_changed(self, current, previous) -> None:
         try:
+            # Qt can re-emit currentChanged for the same index (e.g. after a relayout).
+            if current is not None and previous is not None and current == previous:
+                return
+
             if current is None or (hasattr(current, "isValid") and not current.isValid()):
                 try:
                     if hasattr(self._runs_model, "clear_compare_highlights"):
@@ -1279,6 +1892,7 @@ class BenchmarkController:
                         self._compare_selected_dirs.clear()
                     except Exception:
                         self._compare_selected_dirs = set()
+                    self._compare_sorted_cache = None
                     self._update_compare_btn_state()
             except Exception:
                 pass
@@ -1305,14 +1919,14 @@ class BenchmarkController:
                                 p_r.is_dir()
                                 and p_r.parent is not None
                                 and p_r.parent.resolve() == root_r
-                                and (not _RUN_FOLDER_RE.match(p_r.name))
+                                and (not _is_run_folder_name(p_r.name))
                             )
                         except Exception:
                             # best-effort fallback
                             is_case_dir = (
                                 p.is_dir()
                                 and p.parent == root
-                                and (not _RUN_FOLDER_RE.match(p.name))
+                                and (not _is_run_folder_name(p.name))
                             )
 
                         if is_case_dir:
@@ -1323,36 +1937,39 @@ class BenchmarkController:
                                 pass
 
                             # Find newest run folder inside this case.
-                            best_run = None
+                            # Plain strings in the loop; only the winner becomes a Path.
+                            best_run_str = None
                             best_mtime = -1.0
                             try:
-                                for ent in os.scandir(str(p_r)):
-                                    if not ent.is_dir():
-                                        continue
-                                    cand = Path(ent.path)
-                                    if not _RUN_FOLDER_RE.match(cand.name):
-                                        continue
-
-                                    # Prefer "run_window.csv" mtime, else ALL_SELECTED.png, else folder mtime.
-                                    mt = -1.0
-                                    try:
-                                        csvp = cand / "run_window.csv"
-                                        if csvp.is_file():
-                                            mt = float(csvp.stat().st_mtime)
-                                        else:
-                                            pngp = cand / "ALL_SELECTED.png"
-                                            if pngp.is_file():
-                                                mt = float(pngp.stat().st_mtime)
-                                            else:
-                                                mt = float(cand.stat().st_mtime)
-                                    except Exception:
+                                with os.scandir(str(p_r)) as ents:
+                                    for ent in ents:
+                                        if not ent.is_dir():
+                                            continue
+                                        if not _is_run_folder_name(ent.name):
+                                            continue
+
+                                        # Prefer "run_window.csv" mtime, else ALL_SELECTED.png, else folder mtime.
                                         mt = -1.0
-
-                                    if mt > best_mtime:
-                                        best_mtime = mt
-                                        best_run = cand
+                                        for fname in ("run_window.csv", "ALL_SELECTED.png"):
+                                            try:
+                                                st = os.stat(os.path.join(ent.path, fname))
+                                            except OSError:
+                                                continue
+                                            if stat.S_ISREG(st.st_mode):
+                                                mt = float(st.st_mtime)
+                                                break
+                                        if mt < 0:
+                                            try:
+                                                mt = float(ent.stat().st_mtime)
+                                            except OSError:
+                                                mt = -1.0
+
+                                        if mt > best_mtime:
+                                            best_mtime = mt
+                                            best_run_str = ent.path
                             except Exception:
-                                best_run = None
+                                best_run_str = None
+                            best_run = Path(best_run_str) if best_run_str is not None else None
 
                             if best_run is None:
                                 # Nothing to preview under this case folder.
@@ -1412,6 +2029,9 @@ class BenchmarkController:
 
     def _on_runs_selection_changed(self, selected, deselected):
         try:
+            if selected.isEmpty() and deselected.isEmpty():
+                return
+
             self._update_remove_btn_state()
 
             # Keep compare-selection highlights stable even if a normal click clears selection.
@@ -1582,6 +2202,8 @@ class BenchmarkController:
                 except Exception:
                     # Best-effort: keep going.
                     pass
+            # Arbitrary files/folders (incl. whole cases) may be gone: full rescan.
+            self._invalidate_latest_cache()
 
             try:
                 self._update_remove_btn_state()
@@ -1593,11 +2215,12 @@ class BenchmarkController:
     def remove_selected_results(self) -> None:
         """Delete all selected result folders from disk (bulk)."""
         # Prefer what the user actually selected in the tree.
-        run_dirs = list(sorted(self._selected_run_folders(), key=lambda p: p.name))
+        # Listed by folder name in the confirmation dialog.
+        run_dirs = sorted(self._selected_run_folders(), key=operator.attrgetter("name"))
 
         # If compare-selection is active (it owns selection), fall back to it.
         if not run_dirs and self._compare_selected_dirs:
-            run_dirs = list(sorted(self._compare_selected_dirs, key=lambda p: p.name))
+            run_dirs = self._sorted_compare_dirs()
 
         # Final fallback: current run folder.
         if not run_dirs:
@@ -1615,10 +2238,7 @@ class BenchmarkController:
         warn_block = ""
         try:
             # These are run folders; warn if referenced by compare results.
-            try:
-                root = self._runs_root.resolve()
-            except Exception:
-                root = self._runs_root
+            root = self._runs_root_resolved or self._runs_root
             run_rel = set()
             for rd in run_dirs:
                 try:
@@ -1650,22 +2270,16 @@ class BenchmarkController:
             return
 
         def _is_empty_dir(p: Path) -> bool:
+            # Missing / not-a-directory surface as OSError from scandir itself.
             try:
-                if not p.exists() or not p.is_dir():
-                    return False
                 with os.scandir(str(p)) as it:
-                    for _ in it:
-                        return False
-                return True
-            except Exception:
+                    return next(it, None) is None
+            except OSError:
                 return False
 
         def _cleanup_empty_parents(p: Path) -> None:
             """Remove empty parent folders up to runs_root (exclusive)."""
-            try:
-                root = self._runs_root.resolve()
-            except Exception:
-                root = self._runs_root
+            root = self._runs_root_resolved or self._runs_root
 
             cur = None
             try:
@@ -1693,21 +2307,26 @@ class BenchmarkController:
                 except Exception:
                     return
 
+        # Run folders are independent, so delete them concurrently (metadata-bound I/O).
         failed: list[tuple[Path, str]] = []
-        for rd in run_dirs:
-            try:
-                parent = None
+        removed: list[Path] = []
+        with ThreadPoolExecutor(max_workers=min(8, len(run_dirs))) as pool:
+            futures = [(rd, pool.submit(shutil.rmtree, str(rd))) for rd in run_dirs]
+            for rd, fut in futures:
                 try:
-                    parent = rd.parent
-                except Exception:
-                    parent = None
-                shutil.rmtree(rd)
+                    fut.result()
+                    removed.append(rd)
+                except Exception as exc:
+                    failed.append((rd, str(exc)))
 
-                # If the case folder becomes empty, remove it too.
-                if parent is not None:
-                    _cleanup_empty_parents(parent)
-            except Exception as exc:
-                failed.append((rd, str(exc)))
+        # If a case folder became empty, remove it too (serially: runs may share a case).
+        for rd in removed:
+            try:
+                _cleanup_empty_parents(rd.parent)
+            except Exception:
+                pass
+            # Don't wait for the watcher: select_latest_result below must not get `rd`.
+            self._invalidate_latest_cache(self._case_key_for_run(str(rd)))
 
         # Prune compare selection and clear selection UI
         try:
@@ -1715,6 +2334,8 @@ class BenchmarkController:
                 self._compare_selected_dirs.discard(rd)
         except Exception:
             pass
+        self._compare_sorted_cache = None
+        self._last_expanded_target = None
 
         self._last_selected_path = None
 
@@ -1746,7 +2367,7 @@ class BenchmarkController:
         """
         try:
             root = self._runs_root
-            if not root or not root.exists():
+            if not root or _stat_or_none(root) is None:
                 return
 
             # 1) Determine latest folder (prefer last_run_dir, else cache, else fast scan)
@@ -1754,8 +2375,9 @@ class BenchmarkController:
 
             try:
                 if self.last_run_dir:
-                    cand = Path(self.last_run_dir)
-                    if cand.exists() and cand.is_dir():
+                    st = _stat_or_none(self.last_run_dir)
+                    if st is not None and stat.S_ISDIR(st.st_mode):
+                        cand = Path(self.last_run_dir)
                         target_folder = cand
                         self._latest_cached_folder = cand
                         self._latest_cached_at_ts = time.time()
@@ -1771,34 +2393,54 @@ class BenchmarkController:
             if target_folder is None:
                 return
 
+            target_str = str(target_folder)
+
             # 2) If current selection already points at that folder (or inside it), do nothing
             try:
                 cur_idx = self._runs_tree.currentIndex()
                 cur_path_str = self._idx_to_path(cur_idx) if cur_idx is not None else ""
-                cur_path = Path(cur_path_str) if cur_path_str else None
-
-                if cur_path and cur_path.exists():
-                    cur_dir = cur_path if cur_path.is_dir() else cur_path.parent
-                    if cur_dir.resolve() == target_folder.resolve():
+                cur_st = _stat_or_none(cur_path_str) if cur_path_str else None
+
+                if cur_st is not None:
+                    cur_dir = cur_path_str if stat.S_ISDIR(cur_st.st_mode) else os.path.dirname(cur_path_str)
+                    # Tree paths and target both come from the runs_root tree (run folders
+                    # are never symlinks), so normalized strings decide without resolve().
+                    norm = self._latest_target_norm
+                    if norm is None or norm[0] != target_str:
+                        norm = self._latest_target_norm = (target_str, _norm_path(target_str))
+                    if _norm_path(cur_dir) == norm[1]:
                         return
             except Exception:
                 pass
 
             # 3) Select it in the tree (cheap), then preview on next tick (smooth UI)
-            idx = self._path_to_proxy_index(str(target_folder))
+            idx = self._path_to_proxy_index(target_str)
             if idx is None or (hasattr(idx, "isValid") and not idx.isValid()):
                 return
 
             parent = idx.parent()
-            while parent.isValid():
-                try:
-                    self._runs_tree.expand(parent)
-                except Exception:
-                    pass
-                parent = parent.parent()
-
+            # Same target as last time and still visible (the user may have collapsed it).
+            already = self._last_expanded_target == target_str and (
+                not parent.isValid() or self._runs_tree.isExpanded(parent)
+            )
+            # Expand + select + scroll as one batch: a single repaint at the end instead
+            # of one per expanded ancestor.
+            self._runs_tree.setUpdatesEnabled(False)
             self._suppress_selection_preview = True
             try:
+                if not already:
+                    ancestors = []
+                    while parent.isValid():
+                        ancestors.append(parent)
+                        parent = parent.parent()
+                    # Root first, so no child is expanded under a still-collapsed parent.
+                    for anc in reversed(ancestors):
+                        try:
+                            self._runs_tree.expand(anc)
+                        except Exception:
+                            pass
+                    self._last_expanded_target = target_str
+
                 self._runs_tree.setCurrentIndex(idx)
                 self._runs_tree.scrollTo(idx)
                 sm = self._runs_tree.selectionModel()
@@ -1806,6 +2448,7 @@ class BenchmarkController:
                     sm.select(idx, QItemSelectionModel.ClearAndSelect | QItemSelectionModel.Select)
             finally:
                 self._suppress_selection_preview = False
+                self._runs_tree.setUpdatesEnabled(True)
 
             QTimer.singleShot(0, lambda: self._graph_preview.preview_folder(str(target_folder)))
 
@@ -1828,23 +2471,17 @@ class BenchmarkController:
         s = total_seconds % 60
         return f"{h}:{m:02d}:{s:02d}" if h > 0 else f"{m:02d}:{s:02d}"
 
-    def _write_test_settings_for_run_dir(self, run_dir: Path) -> None:
-        try:
-            if run_dir is None or not run_dir.exists() or not run_dir.is_dir():
-                return
-
-            payload = dict(self._pending_run_settings or {})
-            if not payload:
-                return
+    def _persist_run_dir_async(self, run_dir: str) -> None:
+        """Write test_settings.json + refresh the latest-folder cache without blocking the UI."""
+        payload = dict(self._pending_run_settings or {})
+        QThreadPool.globalInstance().start(_PersistRunRunnable(run_dir, payload, self._persist_signals))
 
-            outp = run_dir / "test_settings.json"
-            try:
-                outp.write_text(json.dumps(payload, indent=2), encoding="utf-8")
-            except Exception:
-                # best-effort
-                pass
-        except Exception:
-            pass
+    def _on_run_persisted(self, run_dir: str, csv_mtime: float) -> None:
+        self._latest_cached_folder = Path(run_dir)
+        self._latest_cached_at_ts = time.time()
+        # best-effort: prefer mtime of run_window.csv if present
+        if csv_mtime >= 0:
+            self._latest_cached_mtime = csv_mtime
 
     def run(self):
         try:
@@ -1854,16 +2491,21 @@ class BenchmarkController:
         except Exception:
             pass
 
-        script = resource_path("cli", "run_case.ps1")
-        if not script.exists():
-            QMessageBox.critical(self.parent, "Missing", f"run_case.ps1 not found: {script}")
-            return
+        script = self._run_script
+        if not self._run_script_exists:
+            # Only re-check a script that was missing earlier (e.g. restored since).
+            self._run_script_exists = script.exists()
+            if not self._run_script_exists:
+                QMessageBox.critical(self.parent, "Missing", f"run_case.ps1 not found: {script}")
+                return
 
         self._save_settings()
 
         self.last_run_dir = None
         self._open_btn.setEnabled(False)
+        self._log_pending.clear()
         self._log.clear()
+        self._cap_log_blocks()
 
         settings = self._get_settings()
         case = settings.get("case_name", "TEST").strip()
@@ -1884,33 +2526,37 @@ class BenchmarkController:
 
         columns = self._sensor_manager.build_selected_columns()
 
-        cmd_parts = [
-            f"& {ps_quote(str(script))}",
-            f"-CaseName {ps_quote(case)}",
-            f"-WarmupSec {warm}",
-            f"-LogSec {logsec}",
-            f"-HwinfoCsv {ps_quote(hwinfo)}",
-            f"-FurDemo {ps_quote(fur_demo)}",
-            f"-FurWidth {fur_w}",
-            f"-FurHeight {fur_h}",
-        ]
-
-        if self._sensor_manager.stress_cpu:
-            cmd_parts.append("-StressCPU")
-        if self._sensor_manager.stress_gpu:
-            cmd_parts.append("-StressGPU")
-        if furmark_exe:
-            cmd_parts.append(f"-FurMarkExe {ps_quote(furmark_exe)}")
-        if prime_exe:
-            cmd_parts.append(f"-PrimeExe {ps_quote(prime_exe)}")
+        # -File + an argument list: PowerShell binds named parameters directly, so no
+        # quoting/escaping and no second parse of a -Command string. Empty strings are
+        # left out (powershell.exe -File drops empty args, unbinding the value).
+        # Named parameters bind in any order, so the per-run values go after the
+        # settings-derived part, which is reused while those settings don't change.
+        launch_key = (
+            str(script), hwinfo, fur_demo, fur_w, fur_h, furmark_exe, prime_exe,
+            bool(self._sensor_manager.stress_cpu), bool(self._sensor_manager.stress_gpu),
+        )
+        cached = self._launch_args_cache
+        if cached is None or cached[0] != launch_key:
+            cached = self._launch_args_cache = (launch_key, self._build_launch_args(*launch_key))
+        args = list(cached[1])
+        if case:
+            args += ["-CaseName", str(case)]
+        args += ["-WarmupSec", str(warm), "-LogSec", str(logsec)]
 
         if columns:
-            cmd_parts.append(f"-TempPatterns {build_ps_array_literal(columns)}")
-
-        cmd = " ".join(cmd_parts)
+            # [string[]] can't be bound through -File; hand the patterns over as a file.
+            patterns_file = self._patterns_file_path
+            try:
+                with open(patterns_file, "w", encoding="utf-8", newline="\n") as f:
+                    f.write("\n".join(str(c) for c in columns))
+                args += ["-TempPatternsFile", patterns_file]
+            except OSError as exc:
+                QMessageBox.critical(self.parent, "Error", f"Cannot write sensor patterns: {exc}")
+                return
 
+        self._flush_log()
         self._append_log("Starting PowerShell:")
-        self._append_log("powershell -NoProfile -ExecutionPolicy Bypass -Command " + cmd)
+        self._append_log("powershell " + subprocess.list2cmdline(args))
         self._append_log("")
 
         self._run_btn.setEnabled(False)
@@ -1921,7 +2567,7 @@ class BenchmarkController:
             return
 
         self.proc.setProgram("powershell")
-        self.proc.setArguments(["-NoProfile", "-ExecutionPolicy", "Bypass", "-Command", cmd])
+        self.proc.setArguments(args)
 
         self._pending_warm = warm
         self._pending_log = logsec
@@ -1965,34 +2611,93 @@ class BenchmarkController:
         except Exception:
             self._pending_run_settings = {}
 
+        self._stdout_buf.clear()
+        self._stderr_buf.clear()
+        self._run_seq += 1
         self.proc.start()
 
+    def _build_launch_args(
+        self, script, hwinfo, fur_demo, fur_w, fur_h, furmark_exe, prime_exe, stress_cpu, stress_gpu
+    ) -> tuple[str, ...]:
+        """PowerShell args that depend only on settings (see run())."""
+        args = [*self._PS_PREFIX, script]
+        if hwinfo:
+            args += ["-HwinfoCsv", str(hwinfo)]
+        if fur_demo:
+            args += ["-FurDemo", str(fur_demo)]
+        args += ["-FurWidth", str(fur_w), "-FurHeight", str(fur_h)]
+        if stress_cpu:
+            args.append("-StressCPU")
+        if stress_gpu:
+            args.append("-StressGPU")
+        if furmark_exe:
+            args += ["-FurMarkExe", str(furmark_exe)]
+        if prime_exe:
+            args += ["-PrimeExe", str(prime_exe)]
+        # The script polls this file during warm-up/logging; abort() just creates it.
+        args += ["-AbortFlag", self._abort_flag_path]
+        return tuple(args)
+
     def abort(self):
         if self.proc is None:
             return
         if self.proc.state() == QProcess.NotRunning:
             return
-        self._append_log("ABORT requested: StopNow")
+        self._flush_log()
+        self._append_log("ABORT requested")
         self._abort_btn.setEnabled(False)
 
-        script = resource_path("cli", "run_case.ps1")
+        # The running script checks the flag every second and stops the stress tools
+        # itself; no second PowerShell has to start for that.
+        try:
+            with open(self._abort_flag_path, "w", encoding="utf-8") as f:
+                f.write("ABORT")
+        except OSError:
+            self._abort_stop_now(self._run_seq)
+            return
+        seq = self._run_seq
+        QTimer.singleShot(_ABORT_FALLBACK_MS, lambda: self._abort_stop_now(seq))
+
+    def _abort_stop_now(self, seq: int) -> None:
+        """Fallback for a run that didn't react to the flag: -StopNow kills the stress tools."""
+        if seq != self._run_seq or self.proc is None or self.proc.state() == QProcess.NotRunning:
+            return
+        # Keep the message after process output that is still queued.
+        self._flush_log()
+        self._append_log("ABORT: still running, sending StopNow")
         p = QProcess(self.parent)
-        p.start("powershell", ["-NoProfile", "-ExecutionPolicy", "Bypass", "-File", str(script), "-StopNow"])
+        p.start("powershell", [*self._PS_PREFIX, str(self._run_script), "-StopNow", "-AbortFlag", self._abort_flag_path])
 
     def on_stdout(self):
         if self.proc is None:
             return
-        data = bytes(self.proc.readAllStandardOutput()).decode("utf-8", errors="replace")
-        for line in data.splitlines():
-            self._append_log(line)
+        self._handle_stdout_text(_take_lines(self._stdout_buf, bytes(self.proc.readAllStandardOutput())))
+
+    def _handle_stdout_text(self, text: str) -> None:
+        lines = text.splitlines()
+        self._queue_log_lines(lines)
+
+        # Each marker is printed once per run; almost every chunk carries none, so
+        # check the whole block once before testing line by line.
+        if _TIMER_PREFIX not in text and "GUI_AMBIENT_CSV:" not in text and "RUN MAP:" not in text:
+            return
+
+        for line in lines:
+            m = None
+            if line.startswith(_TIMER_PREFIX):
+                kind = _TIMER_DISPATCH.get(line.strip())
+                if kind is None:
+                    continue
+            else:
+                m = _GUI_MARKERS_RE.search(line)
+                if m is None:
+                    continue
+                kind = m.lastgroup
 
             # Ambient CSV path (emitted by run_case.ps1) so the GUI can include
             # ambient in live plot + min/max/avg table.
-            if line.startswith("GUI_AMBIENT_CSV:"):
-                try:
-                    ambient_csv = line.split(":", 1)[1].strip()
-                except Exception:
-                    ambient_csv = ""
+            if kind == "ambient":
+                ambient_csv = m.group("ambient").strip()
                 if ambient_csv:
                     try:
                         if callable(getattr(self, "_on_ambient_csv", None)):
@@ -2000,13 +2705,14 @@ class BenchmarkController:
                     except Exception:
                         pass
 
-            if (not self._timer_started) and "GUI_TIMER:WARMUP_START" in line:
-                self._timer_started = True
-                self.start_live_timer(self._pending_warm, self._pending_log)
+            elif kind == "warm":
+                if not self._timer_started:
+                    self._timer_started = True
+                    self.start_live_timer(self._pending_warm, self._pending_log)
 
             # Warmup -> Log window transition: reset live monitor stats so
             # min/max/avg reflect only the logging window.
-            if "GUI_TIMER:LOG_START" in line:
+            elif kind == "logs":
                 try:
                     if callable(getattr(self, "_on_log_started", None)):
                         self._on_log_started()
@@ -2015,44 +2721,79 @@ class BenchmarkController:
 
             # Logging window finished: freeze live monitor stats so they match
             # the Legend & Stats popup (which uses the log window only).
-            if "GUI_TIMER:LOG_END" in line:
+            elif kind == "loge":
                 try:
                     if callable(getattr(self, "_on_log_finished", None)):
                         self._on_log_finished()
                 except Exception:
                     pass
 
-            m = RUNMAP_RE.search(line)
-            if m:
-                self.last_run_dir = m.group(1).strip()
-                # update cache immediately (so Results tab is instant)
-                try:
-                    cand = Path(self.last_run_dir)
-                    if cand.exists() and cand.is_dir():
-                        self._write_test_settings_for_run_dir(cand)
-                        self._latest_cached_folder = cand
-                        self._latest_cached_at_ts = time.time()
-                        # best-effort: prefer mtime of run_window.csv if present
-                        try:
-                            csvp = cand / "run_window.csv"
-                            if csvp.is_file():
-                                self._latest_cached_mtime = float(csvp.stat().st_mtime)
-                        except Exception:
-                            pass
-                except Exception:
-                    pass
+            elif kind == "runmap":
+                self.last_run_dir = m.group("runmap").strip()
+                # update cache as soon as the worker is done (so Results tab is instant)
+                if self.last_run_dir:
+                    self._persist_run_dir_async(self.last_run_dir)
 
     def on_stderr(self):
         if self.proc is None:
             return
-        data = bytes(self.proc.readAllStandardError()).decode("utf-8", errors="replace")
-        for line in data.splitlines():
-            self._append_log("[ERR] " + line)
+        text = _take_lines(self._stderr_buf, bytes(self.proc.readAllStandardError()))
+        self._queue_log_lines(["[ERR] " + line for line in text.splitlines()])
+
+    def _cap_log_blocks(self) -> None:
+        # maximumBlockCount is a QTextDocument property, so it works for QTextEdit too.
+        try:
+            self._log.document().setMaximumBlockCount(_LOG_MAX_BLOCKS)
+        except Exception:
+            pass
+
+    def _queue_log_lines(self, lines: list[str]) -> None:
+        """Buffer process output; bursts within one event-loop turn are written together."""
+        if not lines:
+            return
+        self._log_pending.extend(lines)
+        if not self._log_flush_scheduled:
+            self._log_flush_scheduled = True
+            QTimer.singleShot(0, self._flush_log)
+
+    def _flush_log(self) -> None:
+        """Append all pending lines with a single plain-text insert."""
+        self._log_flush_scheduled = False
+        if not self._log_pending:
+            return
+        text = "\n".join(self._log_pending)
+        self._log_pending.clear()
+        try:
+            doc = self._log.document()
+            sb = self._log.verticalScrollBar()
+            # Follow the output only if the user hasn't scrolled up (like QTextEdit.append).
+            at_bottom = sb.value() >= sb.maximum()
+            cursor = QTextCursor(doc)
+            cursor.movePosition(QTextCursor.End)
+            cursor.insertText(text if doc.isEmpty() else "\n" + text)
+            if at_bottom:
+                sb.setValue(sb.maximum())
+        except Exception:
+            # Fallback: one append through the main window (QTextEdit.append keeps the
+            # embedded newlines as separate paragraphs).
+            self._append_log(text)
 
     def on_finished(self, code, status):
+        # A finished run is the only thing that produces new results (in its own case).
+        self._invalidate_latest_cache(self._case_key_for_run(self.last_run_dir) if self.last_run_dir else None)
+        self._last_expanded_target = None
+
+        # Drain anything still unread, then the last line if it had no newline.
+        self.on_stdout()
+        self.on_stderr()
+        self._handle_stdout_text(_take_tail(self._stdout_buf))
+        self._queue_log_lines(["[ERR] " + line for line in _take_tail(self._stderr_buf).splitlines()])
+
         started_at = None
+        started_mono = None
         try:
             started_at = self._run_started_at
+            started_mono = self._run_started_mono
         except Exception:
             started_at = None
 
@@ -2062,6 +2803,13 @@ class BenchmarkController:
         except Exception:
             finished_at = None
 
+        # The script reads the patterns once at startup; don't leave it in %TEMP%.
+        try:
+            os.unlink(self._patterns_file_path)
+        except OSError:
+            pass
+
+        self._flush_log()
         self._append_log(f"Finished (exit code {code})")
         self._run_btn.setEnabled(True)
         self._abort_btn.setEnabled(False)
@@ -2072,8 +2820,8 @@ class BenchmarkController:
             if callable(getattr(self, "_on_run_finished", None)):
                 elapsed_sec = None
                 try:
-                    if started_at is not None and finished_at is not None:
-                        elapsed_sec = int((finished_at - started_at).total_seconds())
+                    if started_mono is not None:
+                        elapsed_sec = int(time.monotonic() - started_mono)
                 except Exception:
                     elapsed_sec = None
 
@@ -2096,19 +2844,12 @@ class BenchmarkController:
         except Exception:
             pass
 
-        # Refresh cache one more time (in case RUN MAP didn't arrive for some reason)
-        try:
-            if self.last_run_dir:
-                cand = Path(self.last_run_dir)
-                if cand.exists() and cand.is_dir():
-                    self._write_test_settings_for_run_dir(cand)
-                    self._latest_cached_folder = cand
-                    self._latest_cached_at_ts = time.time()
-        except Exception:
-            pass
+        # Persist once more in case RUN MAP didn't arrive (or arrived before the folder).
+        if self.last_run_dir:
+            self._persist_run_dir_async(self.last_run_dir)
 
     def open_run_folder(self):
-        if self.last_run_dir and Path(self.last_run_dir).exists():
+        if self.last_run_dir and os.path.lexists(self.last_run_dir):
             os.startfile(self.last_run_dir)
 
     def is_running(self) -> bool:
@@ -1,9 +1,10 @@
 # ui_selected_sensors.py
 from __future__ import annotations
 
-from collections import defaultdict
+from itertools import groupby
+from operator import itemgetter
 
-from PySide6.QtCore import QEvent, QObject, Qt
+from PySide6.QtCore import QEvent, QObject, Qt, QTimer
 from PySide6.QtWidgets import (
     QDialog,
     QWidget,
@@ -17,10 +18,37 @@ from ..widgets.ui_titlebar import TitleBar
 from ..widgets.ui_rounding import apply_rounded_corners
 from ..graph_preview.ui_dim_overlay import DimOverlay
 from ..widgets.ui_full_row_tree import FullRowHoverTree
-from .ui_sensor_picker import SPD_MAX_TOKEN
+from .ui_sensor_picker import SPD_MAX_TOKEN, format_sensor_display
 
 
 class SelectedSensorsDialog(QDialog):
+    # Match Legend & Stats popup look
+    _STYLE = """
+        QDialog#SelectedSensorsDialog { background: #1A1A1A; border: 1px solid #2A2A2A; border-radius: 10px; }
+        QWidget#TitleBar { background: #151515; }
+
+        QTreeWidget { background: transparent; border: none; color: #EAEAEA; outline: none; }
+        QTreeWidget::item { padding: 6px 6px; background: transparent; }
+        /* Full row hover is painted by FullRowHoverTree (covers left gutter too) */
+        QTreeWidget::item:hover { background: transparent; }
+        QTreeWidget::item:selected, QTreeWidget::item:selected:hover { background: transparent; }
+
+        /* Prevent branch-area selection tint ("blue bar") */
+        QTreeView::branch:selected { background: transparent; }
+        QTreeView::branch:hover { background: transparent; }
+
+        QDialogButtonBox QPushButton {
+            background: #2A2A2A;
+            color: #EAEAEA;
+            border: 1px solid #3A3A3A;
+            border-radius: 8px;
+            padding: 6px 12px;
+            min-width: 88px;
+        }
+        QDialogButtonBox QPushButton:hover { background: #333333; border-color: #4A4A4A; }
+        QDialogButtonBox QPushButton:pressed { background: #252525; }
+        """
+
     def __init__(
         self,
         parent: QWidget,
@@ -67,74 +95,69 @@ class SelectedSensorsDialog(QDialog):
         self.tree.installEventFilter(self)
         root.addWidget(self.tree, 1)
 
-        # Build grouped view
-        grouped: dict[str, list[str]] = defaultdict(list)
+        # Items are filled in after the first paint (see showEvent / _populate_tree),
+        # so the dialog frame appears immediately even for long sensor lists.
+        self._pending_tokens: list[str] | None = list(selected_tokens)
+        self._group_map = group_map
+
+        btns = QDialogButtonBox(QDialogButtonBox.Ok)
+        btns.accepted.connect(self.accept)
+        root.addWidget(btns)
+
+        self.setObjectName("SelectedSensorsDialog")
+        self.setStyleSheet(self._STYLE)
+
+        self.resize(900, 600)
+
+    def _populate_tree(self) -> None:
+        selected_tokens = self._pending_tokens
+        if selected_tokens is None:
+            return
+        self._pending_tokens = None
+        group_map = self._group_map
 
+        # Build grouped view: one (group_lower, group, display) row per entry, sorted
+        # once (stable, so entries keep selection order within their group).
+        rows: list[tuple[str, str, str]] = []
         for tok in selected_tokens:
             if tok == SPD_MAX_TOKEN:
-                grouped["Memory / SPD"].append("SPD Hub (Max of DIMMs)")
+                rows.append(("memory / spd", "Memory / SPD", "SPD Hub (Max of DIMMs)"))
                 continue
 
             grp = group_map.get(tok, "Other")
-            grouped[grp].append(tok)
+            # Same display format as the picker for duplicates: "X #1" -> "X  (#1)"
+            rows.append((grp.lower(), grp, format_sensor_display(tok)))
 
         # If SPD exists (even if not selected) you might want to show it only if selected.
         # Current behavior: show only selected entries.
+        rows.sort(key=itemgetter(0, 1))
 
-        # Insert groups + items
-        for grp in sorted(grouped.keys(), key=lambda s: s.lower()):
+        # Build groups + items detached from the tree, then insert them in one call.
+        group_items: list[QTreeWidgetItem] = []
+        for (_, grp), members in groupby(rows, key=itemgetter(0, 1)):
             gitem = QTreeWidgetItem([grp])
-            gitem.setFirstColumnSpanned(True)
             f = gitem.font(0)
             f.setBold(True)
             gitem.setFont(0, f)
 
-            self.tree.addTopLevelItem(gitem)
-
-            for tok in grouped[grp]:
-                # match your display format for duplicates: "X #1" -> "X  (#1)"
-                disp = tok.replace(" #", "  (#") + (")" if " #" in tok else "")
+            for _, _, disp in members:
                 it = QTreeWidgetItem(gitem, [disp])
                 # keep leaf normal font
                 it.setFlags(it.flags() & ~Qt.ItemIsUserCheckable)
 
-        self.tree.expandAll()
-
-        btns = QDialogButtonBox(QDialogButtonBox.Ok)
-        btns.accepted.connect(self.accept)
-        root.addWidget(btns)
-
-        # Match Legend & Stats popup look
-        self.setObjectName("SelectedSensorsDialog")
-        self.setStyleSheet(
-            """
-            QDialog#SelectedSensorsDialog { background: #1A1A1A; border: 1px solid #2A2A2A; border-radius: 10px; }
-            QWidget#TitleBar { background: #151515; }
-
-            QTreeWidget { background: transparent; border: none; color: #EAEAEA; outline: none; }
-            QTreeWidget::item { padding: 6px 6px; background: transparent; }
-            /* Full row hover is painted by FullRowHoverTree (covers left gutter too) */
-            QTreeWidget::item:hover { background: transparent; }
-            QTreeWidget::item:selected, QTreeWidget::item:selected:hover { background: transparent; }
-
-            /* Prevent branch-area selection tint ("blue bar") */
-            QTreeView::branch:selected { background: transparent; }
-            QTreeView::branch:hover { background: transparent; }
-
-            QDialogButtonBox QPushButton {
-                background: #2A2A2A;
-                color: #EAEAEA;
-                border: 1px solid #3A3A3A;
-                border-radius: 8px;
-                padding: 6px 12px;
-                min-width: 88px;
-            }
-            QDialogButtonBox QPushButton:hover { background: #333333; border-color: #4A4A4A; }
-            QDialogButtonBox QPushButton:pressed { background: #252525; }
-            """
-        )
+            group_items.append(gitem)
 
-        self.resize(900, 600)
+        self.tree.setUpdatesEnabled(False)
+        self.tree.blockSignals(True)
+        try:
+            self.tree.addTopLevelItems(group_items)
+            # Spanning is view state; it only takes effect once the item is in the tree.
+            for gitem in group_items:
+                gitem.setFirstColumnSpanned(True)
+            self.tree.expandAll()
+        finally:
+            self.tree.blockSignals(False)
+            self.tree.setUpdatesEnabled(True)
 
     def _top_window(self) -> QWidget | None:
         try:
@@ -199,6 +222,8 @@ class SelectedSensorsDialog(QDialog):
     def showEvent(self, event):
         super().showEvent(event)
         self._set_dimmed(True)
+        if self._pending_tokens is not None:
+            QTimer.singleShot(0, self._populate_tree)
         p = self.parentWidget()
         if p:
             pg = p.geometry()
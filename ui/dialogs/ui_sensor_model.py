@@ -0,0 +1,230 @@
+# ui_sensor_model.py
+from __future__ import annotations
+
+from typing import Iterable
+
+from PySide6.QtCore import QAbstractItemModel, QModelIndex, Qt
+from PySide6.QtGui import QFont
+
+# internalId of group (top-level) indexes; leaf indexes store their group position + 1,
+# so parent() is a constant-time lookup instead of a search.
+_GROUP_ID = 0
+
+
+def _check_int(value) -> int:
+    # CheckStateRole values arrive as ints or Qt.CheckState depending on the caller.
+    try:
+        return int(value)
+    except TypeError:
+        return int(getattr(value, "value", 0))
+
+
+_CHECKED = _check_int(Qt.Checked)
+
+# Text the search proxy matches against: leaf display text; groups have none.
+FILTER_ROLE = Qt.UserRole + 1
+
+
+class SensorModel(QAbstractItemModel):
+    """
+    Two-level (group -> sensor) checkable model over flat per-leaf arrays.
+
+    - Leaves of a group are contiguous: group g owns leaf ids in group_leaf_ranges[g],
+      and a leaf's row under its group is its offset into that range.
+    - Group check state (tristate) is derived from a per-group checked count.
+    """
+
+    def __init__(self, groups: list[tuple[str, list[tuple[str, str, bool]]]], parent=None):
+        """groups: [(group name, [(display, token, checked), ...]), ...] in display order."""
+        super().__init__(parent)
+
+        self.group_names: list[str] = []
+        self.group_leaf_ranges: list[tuple[int, int]] = []
+        self.leaf_display: list[str] = []
+        self.leaf_token: list[str] = []
+        checked: list[int] = []
+        self._group_checked: list[int] = []
+        self._leaf_group: list[int] = []  # leaf id -> group position
+
+        for name, leaves in groups:
+            start = len(self.leaf_display)
+            n_on = 0
+            for display, token, on in leaves:
+                self.leaf_display.append(display)
+                self.leaf_token.append(token)
+                checked.append(1 if on else 0)
+                self._leaf_group.append(len(self.group_names))
+                n_on += 1 if on else 0
+            self.group_names.append(name)
+            self.group_leaf_ranges.append((start, len(self.leaf_display)))
+            self._group_checked.append(n_on)
+
+        self.leaf_checked = bytearray(checked)
+
+        # Bold group names (leaves remain normal)
+        self._group_font = QFont()
+        self._group_font.setBold(True)
+
+    # ---------------------------
+    # Structure
+    # ---------------------------
+    def index(self, row: int, column: int, parent: QModelIndex = QModelIndex()) -> QModelIndex:
+        if column != 0 or row < 0:
+            return QModelIndex()
+        if not parent.isValid():
+            if row < len(self.group_names):
+                return self.createIndex(row, 0, _GROUP_ID)
+            return QModelIndex()
+        if parent.internalId() != _GROUP_ID:
+            return QModelIndex()
+        g = parent.row()
+        start, end = self.group_leaf_ranges[g]
+        if row < end - start:
+            return self.createIndex(row, 0, g + 1)
+        return QModelIndex()
+
+    def parent(self, index: QModelIndex) -> QModelIndex:  # type: ignore[override]
+        if not index.isValid():
+            return QModelIndex()
+        gid = index.internalId()
+        if gid == _GROUP_ID:
+            return QModelIndex()
+        return self.createIndex(gid - 1, 0, _GROUP_ID)
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        if not parent.isValid():
+            return len(self.group_names)
+        if parent.column() != 0 or parent.internalId() != _GROUP_ID:
+            return 0
+        start, end = self.group_leaf_ranges[parent.row()]
+        return end - start
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 1
+
+    def leaf_id(self, index: QModelIndex) -> int:
+        """Leaf id for a leaf index, -1 for groups / invalid indexes."""
+        if not index.isValid():
+            return -1
+        gid = index.internalId()
+        if gid == _GROUP_ID:
+            return -1
+        return self.group_leaf_ranges[gid - 1][0] + index.row()
+
+    # ---------------------------
+    # Data
+    # ---------------------------
+    def flags(self, index: QModelIndex):
+        if not index.isValid():
+            return Qt.NoItemFlags
+        return Qt.ItemIsEnabled | Qt.ItemIsUserCheckable
+
+    def _group_state(self, g: int):
+        n = self._group_checked[g]
+        if n == 0:
+            return Qt.Unchecked
+        start, end = self.group_leaf_ranges[g]
+        return Qt.Checked if n == end - start else Qt.PartiallyChecked
+
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        gid = index.internalId()
+        if gid == _GROUP_ID:
+            g = index.row()
+            if role == Qt.DisplayRole:
+                return self.group_names[g]
+            if role == Qt.CheckStateRole:
+                return self._group_state(g)
+            if role == Qt.FontRole:
+                return self._group_font
+            return None
+
+        i = self.group_leaf_ranges[gid - 1][0] + index.row()
+        if role == Qt.DisplayRole:
+            return self.leaf_display[i]
+        if role == Qt.CheckStateRole:
+            return Qt.Checked if self.leaf_checked[i] else Qt.Unchecked
+        if role == Qt.UserRole:
+            return self.leaf_token[i]  # exact unique CSV token
+        if role == FILTER_ROLE:
+            return self.leaf_display[i]
+        return None
+
+    def setData(self, index: QModelIndex, value, role: int = Qt.EditRole) -> bool:
+        if role != Qt.CheckStateRole or not index.isValid():
+            return False
+        on = _check_int(value) == _CHECKED
+
+        gid = index.internalId()
+        if gid == _GROUP_ID:
+            # Toggling a group sets all of its leaves (like QTreeWidget's auto-tristate).
+            g = index.row()
+            self._set_group_range(g, *self.group_leaf_ranges[g], on)
+        else:
+            i = self.group_leaf_ranges[gid - 1][0] + index.row()
+            self._set_group_range(gid - 1, i, i + 1, on)
+        return True
+
+    def _set_group_range(self, g: int, lo: int, hi: int, on: bool) -> None:
+        # Flip leaves [lo, hi) of group g; one dataChanged for the leaves, one for the group.
+        val = 1 if on else 0
+        checked = self.leaf_checked
+        delta = 0
+        for i in range(lo, hi):
+            if checked[i] != val:
+                checked[i] = val
+                delta += 1
+        if not delta:
+            return
+        self._group_checked[g] += delta if on else -delta
+
+        start = self.group_leaf_ranges[g][0]
+        gidx = self.createIndex(g, 0, _GROUP_ID)
+        roles = [Qt.CheckStateRole]
+        self.dataChanged.emit(self.index(lo - start, 0, gidx), self.index(hi - 1 - start, 0, gidx), roles)
+        self.dataChanged.emit(gidx, gidx, roles)
+
+    def set_leaves_checked(self, leaf_ids: Iterable[int] | None, on: bool) -> None:
+        """Check/uncheck many leaves (None = all) with one dataChanged per touched group."""
+        val = 1 if on else 0
+        checked = self.leaf_checked
+        ranges = self.group_leaf_ranges
+        counts = self._group_checked
+        # group position -> [first changed leaf, last changed leaf, count]
+        touched: dict[int, list[int]] = {}
+
+        if leaf_ids is None:
+            # Every leaf: groups not already at the target flip entirely.
+            for g, (start, end) in enumerate(ranges):
+                target = end - start if on else 0
+                if counts[g] != target and end > start:
+                    touched[g] = [start, end - 1, abs(target - counts[g])]
+            checked[:] = bytes((val,)) * len(checked)
+        else:
+            leaf_group = self._leaf_group
+            for i in leaf_ids:
+                if checked[i] == val:
+                    continue
+                checked[i] = val
+                g = leaf_group[i]
+                t = touched.get(g)
+                if t is None:
+                    touched[g] = [i, i, 1]
+                else:
+                    if i < t[0]:
+                        t[0] = i
+                    elif i > t[1]:
+                        t[1] = i
+                    t[2] += 1
+
+        roles = [Qt.CheckStateRole]
+        for g, (lo, hi, n) in touched.items():
+            counts[g] += n if on else -n
+            start = ranges[g][0]
+            gidx = self.createIndex(g, 0, _GROUP_ID)
+            self.dataChanged.emit(self.index(lo - start, 0, gidx), self.index(hi - start, 0, gidx), roles)
+            self.dataChanged.emit(gidx, gidx, roles)
+
+    def checked_tokens(self) -> list[str]:
+        return [tok for tok, on in zip(self.leaf_token, self.leaf_checked) if on and tok]
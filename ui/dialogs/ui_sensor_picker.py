@@ -1,7 +1,7 @@
 # ui_sensor_picker.py
 from __future__ import annotations
 
-from PySide6.QtCore import QEvent, QObject, Qt
+from PySide6.QtCore import QEvent, QObject, QSortFilterProxyModel, Qt, QTimer
 from PySide6.QtWidgets import (
     QDialog,
     QWidget,
@@ -9,7 +9,6 @@ from PySide6.QtWidgets import (
     QHBoxLayout,
     QLineEdit,
     QPushButton,
-    QTreeWidgetItem,
     QDialogButtonBox,
     QAbstractItemView,
 )
@@ -17,11 +16,18 @@ from PySide6.QtWidgets import (
 from ..widgets.ui_titlebar import TitleBar
 from ..widgets.ui_rounding import apply_rounded_corners
 from ..graph_preview.ui_dim_overlay import DimOverlay
-from ..widgets.ui_full_row_tree import FullRowHoverTree
+from ..widgets.ui_full_row_tree import FullRowHoverView
+from .ui_sensor_model import FILTER_ROLE, SensorModel
 
 SPD_MAX_TOKEN = "__SPD_MAX__"
 
 
+def format_sensor_display(token: str) -> str:
+    """Display formatting for duplicate columns: "X #1" -> "X  (#1)"."""
+    base, sep, rest = token.partition(" #")
+    return f"{base}  (#{rest})" if sep else token
+
+
 class SensorPickerDialog(QDialog):
     def __init__(
         self,
@@ -35,6 +41,8 @@ class SensorPickerDialog(QDialog):
 
         self._dim_overlay: DimOverlay | None = None
         self._overlay_filter: QObject | None = None
+        # Parent's top window while dimmed; the overlay filter re-enters on every resize.
+        self._top_cached: QWidget | None = None
 
         self.corner_radius = 12  # <-- adjust for this window
         apply_rounded_corners(self, self.corner_radius)
@@ -64,9 +72,15 @@ class SensorPickerDialog(QDialog):
         top = QHBoxLayout()
         top.setSpacing(10)
 
+        # Coalesce fast typing into one filter pass once the user pauses.
+        self._filter_timer = QTimer(self)
+        self._filter_timer.setSingleShot(True)
+        self._filter_timer.setInterval(50)
+        self._filter_timer.timeout.connect(self._apply_filter)
+
         self.search = QLineEdit()
         self.search.setPlaceholderText("Search sensors… (e.g. CPU, GPU, VRM, Temp)")
-        self.search.textChanged.connect(self._apply_filter)
+        self.search.textChanged.connect(self._on_search_changed)
 
         self.btn_all = QPushButton("Select all")
         self.btn_none = QPushButton("Deselect all")
@@ -79,7 +93,35 @@ class SensorPickerDialog(QDialog):
         root.addLayout(top)
 
         # ---------- Tree ----------
-        self.tree = FullRowHoverTree(hover_rgba=(255, 255, 255, 15), selected_rgba=(255, 255, 255, 18))
+        # Sensors live in flat per-leaf arrays behind a model instead of one
+        # QTreeWidgetItem per row.
+        grouped: dict[str, list[tuple[str, str, bool]]] = {}  # groups in order of first appearance
+
+        # ---------- Optional SPD Max helper ----------
+        if has_spd:
+            grouped.setdefault("Memory / SPD", []).append(
+                ("SPD Hub (Max of DIMMs)", SPD_MAX_TOKEN, SPD_MAX_TOKEN in preselected)
+            )
+
+        # ---------- Insert sensors ----------
+        for uniq_leaf in csv_unique_leafs:
+            grp = group_map.get(uniq_leaf, "Other")
+            grouped.setdefault(grp, []).append(
+                (format_sensor_display(uniq_leaf), uniq_leaf, uniq_leaf in preselected)
+            )
+
+        self.model = SensorModel(list(grouped.items()), self)
+
+        # The search runs in the proxy (Qt-side matching). Groups carry no filter text,
+        # so they only show while one of their leaves matches (recursive filtering).
+        self.proxy = QSortFilterProxyModel(self)
+        self.proxy.setSourceModel(self.model)
+        self.proxy.setRecursiveFilteringEnabled(True)
+        self.proxy.setFilterKeyColumn(0)
+        self.proxy.setFilterRole(FILTER_ROLE)
+        self.proxy.setFilterCaseSensitivity(Qt.CaseInsensitive)
+
+        self.tree = FullRowHoverView(hover_rgba=(255, 255, 255, 15), selected_rgba=(255, 255, 255, 18))
         self.tree.setHeaderHidden(True)
         self.tree.setUniformRowHeights(True)
         self.tree.setSelectionMode(QAbstractItemView.NoSelection)
@@ -89,58 +131,12 @@ class SensorPickerDialog(QDialog):
         # We handle clicks via an eventFilter so the user doesn't need to click the checkbox itself.
         self.tree.viewport().installEventFilter(self)
         self.tree.installEventFilter(self)
+        # Groups start collapsed (the view's default for a fresh model).
+        self.tree.setModel(self.proxy)
         root.addWidget(self.tree, 1)
 
-        self.group_items: dict[str, QTreeWidgetItem] = {}
-        self.leaf_items: list[QTreeWidgetItem] = []
-
-        def ensure_group(gname: str) -> QTreeWidgetItem:
-            if gname in self.group_items:
-                return self.group_items[gname]
-
-            gi = QTreeWidgetItem([gname])
-            gi.setFirstColumnSpanned(True)
-            gi.setFlags(
-                gi.flags()
-                | Qt.ItemFlag.ItemIsAutoTristate
-                | Qt.ItemFlag.ItemIsUserCheckable
-            )
-            gi.setCheckState(0, Qt.Unchecked)
-
-            # Bold group names (leaves remain normal)
-            f = gi.font(0)
-            f.setBold(True)
-            gi.setFont(0, f)
-
-            self.tree.addTopLevelItem(gi)
-            self.group_items[gname] = gi
-            return gi
-
-        # ---------- Optional SPD Max helper ----------
-        if has_spd:
-            g = ensure_group("Memory / SPD")
-            checked = (SPD_MAX_TOKEN in preselected)
-            it = QTreeWidgetItem(g, ["SPD Hub (Max of DIMMs)"])
-            it.setFlags(it.flags() | Qt.ItemFlag.ItemIsUserCheckable)
-            it.setCheckState(0, Qt.Checked if checked else Qt.Unchecked)
-            it.setData(0, Qt.UserRole, SPD_MAX_TOKEN)
-            self.leaf_items.append(it)
-
-        # ---------- Insert sensors ----------
-        for uniq_leaf in csv_unique_leafs:
-            grp = group_map.get(uniq_leaf, "Other")
-            g = ensure_group(grp)
-
-            # Display formatting: "X #1" -> "X  (#1)"
-            display = uniq_leaf.replace(" #", "  (#") + (")" if " #" in uniq_leaf else "")
-            it = QTreeWidgetItem(g, [display])
-            it.setFlags(it.flags() | Qt.ItemFlag.ItemIsUserCheckable)
-            it.setCheckState(0, Qt.Checked if (uniq_leaf in preselected) else Qt.Unchecked)
-            it.setData(0, Qt.UserRole, uniq_leaf)  # store exact unique CSV token
-            self.leaf_items.append(it)
-
-        # Start collapsed for readability
-        self.tree.collapseAll()
+        # Last applied query ("" = no filter).
+        self._filter_q = ""
 
         # ---------- OK / Cancel ----------
         btns = QDialogButtonBox(QDialogButtonBox.Ok | QDialogButtonBox.Cancel)
@@ -173,11 +169,11 @@ class SensorPickerDialog(QDialog):
             QPushButton:hover { background: #333333; border-color: #4A4A4A; }
             QPushButton:pressed { background: #252525; }
 
-            QTreeWidget { background: transparent; border: none; color: #EAEAEA; outline: none; }
-            QTreeWidget::item { padding: 6px 6px; background: transparent; }
-            /* Full row hover is painted by FullRowHoverTree (covers left gutter too) */
-            QTreeWidget::item:hover { background: transparent; }
-            QTreeWidget::item:selected, QTreeWidget::item:selected:hover { background: transparent; }
+            QTreeView { background: transparent; border: none; color: #EAEAEA; outline: none; }
+            QTreeView::item { padding: 6px 6px; background: transparent; }
+            /* Full row hover is painted by FullRowHoverView (covers left gutter too) */
+            QTreeView::item:hover { background: transparent; }
+            QTreeView::item:selected, QTreeView::item:selected:hover { background: transparent; }
 
             /* Prevent branch-area selection tint ("blue bar") */
             QTreeView::branch:selected { background: transparent; }
@@ -199,9 +195,11 @@ class SensorPickerDialog(QDialog):
             return None
 
     def _ensure_dim_overlay(self) -> None:
-        top = self._top_window()
+        top = self._top_cached
         if top is None:
-            return
+            top = self._top_cached = self._top_window()
+            if top is None:
+                return
 
         if self._dim_overlay is None or self._dim_overlay.parentWidget() is not top:
             try:
@@ -244,14 +242,22 @@ class SensorPickerDialog(QDialog):
                     self._dim_overlay.show()
                     self._dim_overlay.raise_()
             else:
+                # Re-resolved on the next show (the dialog may be re-parented in between).
+                self._top_cached = None
                 if self._dim_overlay is not None:
                     self._dim_overlay.hide()
         except Exception:
             pass
 
+    def _dim_after_show(self) -> None:
+        # Closed again before the deferred call ran: don't bring the overlay back.
+        if self.isVisible():
+            self._set_dimmed(True)
+
     def showEvent(self, event):
         super().showEvent(event)
-        self._set_dimmed(True)
+        # Let the dialog paint first; building the overlay isn't needed for that.
+        QTimer.singleShot(0, self._dim_after_show)
         p = self.parentWidget()
         if p:
             pg = p.geometry()
@@ -279,11 +285,34 @@ class SensorPickerDialog(QDialog):
             pass
         return super().reject()
 
+    def _on_search_changed(self, text: str) -> None:
+        if not text.strip():
+            # Clearing the search restores the full list right away.
+            self._filter_timer.stop()
+            self._apply_filter()
+            return
+        self._filter_timer.start()
+
     def _set_all_checked(self, checked: bool):
-        state = Qt.Checked if checked else Qt.Unchecked
-        for it in self.leaf_items:
-            if not it.isHidden():
-                it.setCheckState(0, state)
+        # Act on what the pending search will show, not on the previous filter.
+        if self._filter_timer.isActive():
+            self._filter_timer.stop()
+            self._apply_filter()
+        # One bulk model update instead of a setData (and its signals) per leaf.
+        self.model.set_leaves_checked(self._visible_leaf_ids(), checked)
+
+    def _visible_leaf_ids(self) -> list[int] | None:
+        """Model leaf ids the current search shows (None = no search, all leaves)."""
+        if not self._filter_q:
+            return None
+        proxy = self.proxy
+        leaf_id = self.model.leaf_id
+        out: list[int] = []
+        for g in range(proxy.rowCount()):
+            pg = proxy.index(g, 0)
+            for r in range(proxy.rowCount(pg)):
+                out.append(leaf_id(proxy.mapToSource(proxy.index(r, 0, pg))))
+        return out
 
     def eventFilter(self, obj, event):
         # One-press behavior matching Legend & Stats:
@@ -296,24 +325,26 @@ class SensorPickerDialog(QDialog):
                 except Exception:
                     pos = event.pos()
 
-                item = self.tree.itemAt(pos)
-                if item is None:
+                idx = self.tree.indexAt(pos)
+                if not idx.isValid():
                     return False
 
-                rect = self.tree.visualItemRect(item)
+                rect = self.tree.visualRect(idx)
                 in_checkbox_gutter = (pos.x() - rect.x()) < 24
 
                 # Let Qt handle checkbox clicks (group tristate + leaf checkbox)
                 if in_checkbox_gutter:
                     return False
 
-                if item.childCount() > 0:
-                    item.setExpanded(not item.isExpanded())
+                if not idx.parent().isValid():
+                    self.tree.setExpanded(idx, not self.tree.isExpanded(idx))
                     return True
 
                 # Leaf: toggle check
-                cs = item.checkState(0)
-                item.setCheckState(0, Qt.Unchecked if cs == Qt.Checked else Qt.Checked)
+                model = idx.model()
+                # Proxies can hand the role back as a plain int; normalize before comparing.
+                cs = Qt.CheckState(model.data(idx, Qt.CheckStateRole))
+                model.setData(idx, Qt.Unchecked if cs == Qt.Checked else Qt.Checked, Qt.CheckStateRole)
                 return True
             except Exception:
                 return False
@@ -321,32 +352,22 @@ class SensorPickerDialog(QDialog):
         return super().eventFilter(obj, event)
 
     def _apply_filter(self):
-        q = self.search.text().strip().lower()
-
-        for g in self.group_items.values():
-            any_visible = False
-
-            for i in range(g.childCount()):
-                c = g.child(i)
-                txt = c.text(0).lower()
-                match = (not q) or (q in txt)
-                c.setHidden(not match)
-                if match:
-                    any_visible = True
+        q = self.search.text().strip()
+        if q == self._filter_q:
+            return
+        self._filter_q = q
 
-            g.setHidden(not any_visible)
+        self.tree.setUpdatesEnabled(False)
+        try:
+            self.proxy.setFilterFixedString(q)
 
-            # Auto-expand visible groups when searching; collapse otherwise
-            if q and any_visible:
-                self.tree.expandItem(g)
+            # Auto-expand groups when searching (hidden ones stay hidden); collapse otherwise
+            if q:
+                self.tree.expandAll()
             else:
-                self.tree.collapseItem(g)
+                self.tree.collapseAll()
+        finally:
+            self.tree.setUpdatesEnabled(True)
 
     def selected_tokens(self) -> list[str]:
-        out: list[str] = []
-        for it in self.leaf_items:
-            if it.checkState(0) == Qt.Checked:
-                tok = it.data(0, Qt.UserRole)
-                if tok:
-                    out.append(str(tok))
-        return out
+        return self.model.checked_tokens()
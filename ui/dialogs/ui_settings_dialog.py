@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 import os
+from functools import lru_cache
 from pathlib import Path
 
 from PySide6.QtCore import Qt
@@ -27,6 +28,71 @@ from ..widgets.ui_titlebar import TitleBar
 from ..widgets.ui_rounding import apply_rounded_corners
 
 
+# (bg, fg, selection bg, selection fg) for the mode combo popup.
+_POPUP_COLORS = {
+    "light": ("#FFFFFF", "#1A1A1A", "#CFE4FF", "#1A1A1A"),
+    "dark": ("#1A1A1A", "#EAEAEA", "#2A2A2A", "#EAEAEA"),
+}
+
+
+def _resolve_arrow(arrow) -> str:
+    try:
+        p = Path(arrow)
+        if p.exists():
+            return str(p.resolve()).replace('\\', '/')
+    except Exception:
+        pass
+    return str(arrow).replace('\\', '/')
+
+
+@lru_cache(maxsize=8)
+def _mode_combo_styles(arrow: str, mode: str) -> tuple[str, str]:
+    """Return (combo stylesheet, view stylesheet) for a resolved arrow path and mode."""
+    popup_bg, popup_fg, popup_sel_bg, popup_sel_fg = _POPUP_COLORS[mode]
+    combo_ss = f"""
+        QComboBox {{
+            padding-right: 22px;      /* room for arrow */
+        }}
+
+        QComboBox::drop-down {{
+            border: none;             /* removes the box */
+            background: transparent;
+            width: 22px;              /* clickable area */
+        }}
+
+        QComboBox::down-arrow {{
+            image: url("{arrow}");
+            width: 10px;
+            height: 6px;
+        }}
+
+        QComboBox QAbstractItemView {{
+            border: 0px;
+            outline: 0px;
+            background-color: {popup_bg};
+            color: {popup_fg};
+            selection-background-color: {popup_sel_bg};
+            selection-color: {popup_sel_fg};
+        }}
+
+        QComboBox QAbstractItemView::item {{
+            padding: 6px 10px;
+        }}
+
+        QComboBoxPrivateContainer {{
+            border: 0px;
+            background: transparent;
+        }}
+        QComboBoxPrivateContainer QFrame {{
+            border: 0px;
+            background: transparent;
+            padding: 0px;
+            margin: 0px;
+        }}
+        """
+    return combo_ss, f"background-color: {popup_bg}; color: {popup_fg};"
+
+
 class SettingsDialog(QDialog):
     def __init__(
         self,
@@ -93,7 +159,9 @@ class SettingsDialog(QDialog):
         self.mode_combo.addItems(["Light", "Dark", "Device"])
 
         arrow_path = resource_path("resources", "icons", "down_triangle.svg")
-        self._mode_combo_arrow = arrow_path
+        # Resolved once; the popup styles for each mode are cached off this path.
+        self._mode_combo_arrow = _resolve_arrow(arrow_path)
+        self._mode_combo_applied: str | None = None
 
         # Apply initial popup style based on input theme and update it when selection changes
         self._apply_mode_combo_theme(theme)
@@ -199,75 +267,24 @@ class SettingsDialog(QDialog):
         This is called on init and whenever the combo selection changes.
         """
         mode = self._resolve_theme(t if isinstance(t, str) else (t or "dark"))
-        if mode == "light":
-            popup_bg = "#FFFFFF"
-            popup_fg = "#1A1A1A"
-            popup_sel_bg = "#CFE4FF"
-            popup_sel_fg = "#1A1A1A"
-        else:
-            popup_bg = "#1A1A1A"
-            popup_fg = "#EAEAEA"
-            popup_sel_bg = "#2A2A2A"
-            popup_sel_fg = "#EAEAEA"
-
-        arrow = getattr(self, "_mode_combo_arrow", None) or resource_path("resources", "icons", "down_triangle.svg")
-        try:
-            p = _Path(arrow)
-            if p.exists():
-                arrow = str(p.resolve()).replace('\\', '/')
-            else:
-                arrow = str(arrow).replace('\\', '/')
-        except Exception:
-            arrow = str(arrow).replace('\\', '/')
-
-        self.mode_combo.setStyleSheet(f"""
-        QComboBox {{
-            padding-right: 22px;      /* room for arrow */
-        }}
+        if mode == getattr(self, "_mode_combo_applied", None):
+            # Light <-> Device (or Dark <-> Device) often resolves to the same mode.
+            return
+        popup_bg, popup_fg, popup_sel_bg, popup_sel_fg = _POPUP_COLORS[mode]
 
-        QComboBox::drop-down {{
-            border: none;             /* removes the box */
-            background: transparent;
-            width: 22px;              /* clickable area */
-        }}
-
-        QComboBox::down-arrow {{
-            image: url("{arrow}");
-            width: 10px;
-            height: 6px;
-        }}
-
-        QComboBox QAbstractItemView {{
-            border: 0px;
-            outline: 0px;
-            background-color: {popup_bg};
-            color: {popup_fg};
-            selection-background-color: {popup_sel_bg};
-            selection-color: {popup_sel_fg};
-        }}
-
-        QComboBox QAbstractItemView::item {{
-            padding: 6px 10px;
-        }}
-
-        QComboBoxPrivateContainer {{
-            border: 0px;
-            background: transparent;
-        }}
-        QComboBoxPrivateContainer QFrame {{
-            border: 0px;
-            background: transparent;
-            padding: 0px;
-            margin: 0px;
-        }}
-        """)
+        arrow = getattr(self, "_mode_combo_arrow", None) or _resolve_arrow(
+            resource_path("resources", "icons", "down_triangle.svg")
+        )
+        combo_ss, view_ss = _mode_combo_styles(arrow, mode)
+        self.mode_combo.setStyleSheet(combo_ss)
+        self._mode_combo_applied = mode
 
         # Also apply styling directly to the underlying view and its palette. Some platforms
         # show the popup as a separate window and prefer the view's palette over stylesheets.
         try:
             view = self.mode_combo.view()
             # Ensure visual colors via stylesheet
-            view.setStyleSheet(f"background-color: {popup_bg}; color: {popup_fg};")
+            view.setStyleSheet(view_ss)
 
             pal = view.palette()
             pal.setColor(QPalette.Base, QColor(popup_bg))
@@ -279,7 +296,7 @@ class SettingsDialog(QDialog):
             # Also try to style the popup window itself if available
             try:
                 popup_win = view.window()
-                popup_win.setStyleSheet(f"background-color: {popup_bg}; color: {popup_fg};")
+                popup_win.setStyleSheet(view_ss)
             except Exception:
                 pass
         except Exception:
@@ -48,7 +48,7 @@ from .live_graph_widget import LiveGraphWidget
 # keep if you have it
 from .runs_proxy_model import RunsProxyModel
 
-from core.settings_store import get_settings_path, load_json, save_json
+from core.settings_store import Settings, get_settings_path, load_json, save_json
 
 from ui.ntfy_notifier import NtfyNotifier
 
@@ -1624,23 +1624,23 @@ class MainWindow(QWidget):
 
     def save_settings(self):
         """Save settings to JSON file."""
-        payload = {
-            "case_name": self.case_edit.text().strip(),
-            "hwinfo_csv": self.hwinfo_edit.text().strip(),
-            "warmup_min": int(self.warmup_min.value()),
-            "warmup_sec": int(self.warmup_sec.value()),
-            "log_min": int(self.log_min.value()),
-            "log_sec": int(self.log_sec.value()),
-            "fur_demo_display": self.fur_demo_combo.currentText(),
-            "fur_res_display": self.fur_res_combo.currentText(),
-            "selected_tokens": list(self.sensors.selected_tokens),
-            "stress_cpu": bool(self.sensors.stress_cpu),
-            "stress_gpu": bool(self.sensors.stress_gpu),
-            "furmark_exe": self.furmark_exe,
-            "prime_exe": self.prime_exe,
-            "ntfy_topic": self.ntfy_topic,
-            "theme": self.theme_mode,
-        }
+        payload = Settings(
+            case_name=self.case_edit.text().strip(),
+            hwinfo_csv=self.hwinfo_edit.text().strip(),
+            warmup_min=int(self.warmup_min.value()),
+            warmup_sec=int(self.warmup_sec.value()),
+            log_min=int(self.log_min.value()),
+            log_sec=int(self.log_sec.value()),
+            fur_demo_display=self.fur_demo_combo.currentText(),
+            fur_res_display=self.fur_res_combo.currentText(),
+            selected_tokens=list(self.sensors.selected_tokens),
+            stress_cpu=bool(self.sensors.stress_cpu),
+            stress_gpu=bool(self.sensors.stress_gpu),
+            furmark_exe=self.furmark_exe,
+            prime_exe=self.prime_exe,
+            ntfy_topic=self.ntfy_topic,
+            theme=self.theme_mode,
+        )
         save_json(self.settings_path, payload)
         self._update_run_button_state()
 
@@ -2134,6 +2134,12 @@ class MainWindow(QWidget):
                 except Exception:
                     pass
 
+                # The latest-run cache may still point into the old case folder.
+                try:
+                    self.benchmark.invalidate_latest_result()
+                except Exception:
+                    pass
+
                 # Re-select renamed folder (best-effort; model updates async).
                 def _reselect():
                     try:
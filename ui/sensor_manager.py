@@ -60,6 +60,9 @@ class SensorManager:
         self._csv_updating = False
         self._csv_update_window = 2.0
 
+        # Parsed sensor_map.json, keyed by file mtime: (mtime, payload)
+        self._sensor_map_cache: tuple[float, dict] | None = None
+
         # Start monitoring timers
         self._csv_timer = QTimer(self.parent)
         self._csv_timer.setInterval(700)
@@ -144,12 +147,23 @@ class SensorManager:
     def _ensure_precise_map(self, csv_leafs: list[str], csv_unique_leafs: list[str]) -> dict[str, str]:
         """Ensure precise group mapping exists, creating it if needed."""
         cache_path = resource_path("resources", "sensor_map.json")
-        payload = load_sensor_map(cache_path)
+        try:
+            mtime = cache_path.stat().st_mtime
+        except OSError:
+            mtime = None
+
+        if mtime is not None and self._sensor_map_cache and self._sensor_map_cache[0] == mtime:
+            payload = self._sensor_map_cache[1]
+        else:
+            payload = load_sensor_map(cache_path)
+            self._sensor_map_cache = (mtime, payload) if (mtime is not None and payload) else None
+
         if payload and payload.get("schema") == 1 and payload.get("header_unique") == csv_unique_leafs:
             return dict(payload.get("mapping", {}))
 
         mapping = build_precise_group_map(csv_leafs, csv_unique_leafs)
         save_sensor_map(cache_path, csv_unique_leafs, mapping)
+        self._sensor_map_cache = None
         return mapping
 
     def open_selected_sensors_view(self) -> None:
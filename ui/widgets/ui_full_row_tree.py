@@ -2,11 +2,11 @@ from __future__ import annotations
 
 from PySide6.QtCore import QModelIndex, Qt
 from PySide6.QtGui import QColor
-from PySide6.QtWidgets import QStyle, QTreeWidget
+from PySide6.QtWidgets import QStyle, QTreeView, QTreeWidget
 
 
-class FullRowHoverTree(QTreeWidget):
-    """QTreeWidget that paints hover/selection backgrounds across the full row.
+class _FullRowHoverMixin:
+    """Paints hover/selection backgrounds across the full row of a tree view.
 
     Qt's default hover/selection background often doesn't cover the branch/indent
     area, which makes the left gutter look like a different color.
@@ -100,3 +100,11 @@ class FullRowHoverTree(QTreeWidget):
         except Exception:
             pass
         return super().leaveEvent(event)
+
+
+class FullRowHoverTree(_FullRowHoverMixin, QTreeWidget):
+    """QTreeWidget with full-row hover/selection backgrounds."""
+
+
+class FullRowHoverView(_FullRowHoverMixin, QTreeView):
+    """QTreeView (model-based) with full-row hover/selection backgrounds."""
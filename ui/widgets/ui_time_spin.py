@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from PySide6.QtCore import Qt
+from PySide6.QtCore import QEvent, Qt
 from PySide6.QtGui import QFontMetrics, QWheelEvent, QKeyEvent
 from PySide6.QtWidgets import QSpinBox, QSizePolicy
 
@@ -11,6 +11,18 @@ class KeyboardOnlySpinBox(QSpinBox):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.setButtonSymbols(QSpinBox.NoButtons)
+        # Width of "0" in the current font; measured lazily, dropped on font change.
+        self._digit_w: int | None = None
+
+    def digit_width(self) -> int:
+        if self._digit_w is None:
+            self._digit_w = QFontMetrics(self.font()).horizontalAdvance("0")
+        return self._digit_w
+
+    def changeEvent(self, event) -> None:
+        super().changeEvent(event)
+        if event.type() == QEvent.FontChange:
+            self._digit_w = None
 
     def stepBy(self, steps: int) -> None:
         return
@@ -33,11 +45,9 @@ def make_time_spin(min_chars: int, max_value: int, initial: int) -> QSpinBox:
     sp.setSizePolicy(QSizePolicy.Minimum, QSizePolicy.Fixed)
 
     def update_width():
-        txt = str(sp.value())
-        shown_len = max(min_chars, len(txt))
-        fm = QFontMetrics(sp.font())
-        w = fm.horizontalAdvance("0" * shown_len) + 30
-        sp.setFixedWidth(w)
+        shown_len = max(min_chars, len(str(sp.value())))
+        # Digit width only changes with the font, so it's cached on the spin box.
+        sp.setFixedWidth(sp.digit_width() * shown_len + 30)
 
     sp.valueChanged.connect(lambda *_: update_width())
     update_width()